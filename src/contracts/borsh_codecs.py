@@ -0,0 +1,574 @@
+"""
+Borsh codecs for the DAPPR program types
+
+Generated by codegen.py from src/lib.rs, do not edit by hand.
+"""
+import enum
+import struct
+
+_U32 = struct.Struct("<I")
+_STRUCT_0 = struct.Struct("<?32s")
+_STRUCT_1 = struct.Struct("<BQQ")
+_STRUCT_2 = struct.Struct("<32s")
+_STRUCT_3 = struct.Struct("<32sB")
+_STRUCT_4 = struct.Struct("<?")
+_STRUCT_5 = struct.Struct("<qQ?")
+_STRUCT_6 = struct.Struct("<?32s32sQQB")
+_STRUCT_7 = struct.Struct("<Q")
+_STRUCT_8 = struct.Struct("<qQ")
+_STRUCT_9 = struct.Struct("<B")
+_STRUCT_10 = struct.Struct("<Q32s")
+
+
+class _Codec:
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return type(other) is type(self) and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __repr__(self):
+        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)
+        return f'{type(self).__name__}({fields})'
+
+    def encode(self) -> bytes:
+        buf = bytearray(self.encoded_size())
+        self.encode_into(buf, 0)
+        return bytes(buf)
+
+    @classmethod
+    def decode(cls, data):
+        return cls.decode_from(data, 0)[0]
+
+
+class ResearchProject(_Codec):
+    __slots__ = ('is_initialized', 'owner', 'title', 'description', 'status', 'funding_goal', 'funds_raised', 'participants', 'ip_terms', 'milestones', 'metadata_hash')
+
+    def __init__(self, is_initialized, owner, title, description, status, funding_goal, funds_raised, participants, ip_terms, milestones, metadata_hash):
+        self.is_initialized = is_initialized
+        self.owner = owner
+        self.title = title
+        self.description = description
+        self.status = status
+        self.funding_goal = funding_goal
+        self.funds_raised = funds_raised
+        self.participants = participants
+        self.ip_terms = ip_terms
+        self.milestones = milestones
+        self.metadata_hash = metadata_hash
+
+    def encoded_size(self):
+        return _STRUCT_0.size + 4 + len(self.title.encode('utf-8')) + 4 + len(self.description.encode('utf-8')) + _STRUCT_1.size + 4 + len(self.participants) * _STRUCT_2.size + self.ip_terms.encoded_size() + 4 + sum(_item0.encoded_size() for _item0 in self.milestones) + (1 if self.metadata_hash is None else 1 + _STRUCT_2.size)
+
+    def encode_into(self, buf, offset):
+        if len(self.owner) != 32:
+            raise ValueError(f'Expected 32 bytes, got {len(self.owner)}')
+        _STRUCT_0.pack_into(buf, offset, self.is_initialized, self.owner)
+        offset += _STRUCT_0.size
+        _raw0 = self.title.encode('utf-8')
+        _U32.pack_into(buf, offset, len(_raw0))
+        offset += 4
+        buf[offset:offset + len(_raw0)] = _raw0
+        offset += len(_raw0)
+        _raw0 = self.description.encode('utf-8')
+        _U32.pack_into(buf, offset, len(_raw0))
+        offset += 4
+        buf[offset:offset + len(_raw0)] = _raw0
+        offset += len(_raw0)
+        _STRUCT_1.pack_into(buf, offset, self.status, self.funding_goal, self.funds_raised)
+        offset += _STRUCT_1.size
+        _U32.pack_into(buf, offset, len(self.participants))
+        offset += 4
+        for _item0 in self.participants:
+            if len(_item0) != 32:
+                raise ValueError(f'Expected 32 bytes, got {len(_item0)}')
+            _STRUCT_2.pack_into(buf, offset, _item0)
+            offset += _STRUCT_2.size
+        offset = self.ip_terms.encode_into(buf, offset)
+        _U32.pack_into(buf, offset, len(self.milestones))
+        offset += 4
+        for _item0 in self.milestones:
+            offset = _item0.encode_into(buf, offset)
+        if self.metadata_hash is None:
+            buf[offset] = 0
+            offset += 1
+        else:
+            buf[offset] = 1
+            offset += 1
+            if len(self.metadata_hash) != 32:
+                raise ValueError(f'Expected 32 bytes, got {len(self.metadata_hash)}')
+            _STRUCT_2.pack_into(buf, offset, self.metadata_hash)
+            offset += _STRUCT_2.size
+        return offset
+
+    @classmethod
+    def decode_from(cls, buf, offset=0):
+        is_initialized, owner = _STRUCT_0.unpack_from(buf, offset)
+        if buf[offset] > 1:
+            raise ValueError(f'Invalid bool at offset {offset}')
+        offset += _STRUCT_0.size
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        title = str(buf[offset:offset + _len0], 'utf-8')
+        offset += _len0
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        description = str(buf[offset:offset + _len0], 'utf-8')
+        offset += _len0
+        status, funding_goal, funds_raised = _STRUCT_1.unpack_from(buf, offset)
+        offset += _STRUCT_1.size
+        status = ProjectStatus(status)
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 * _STRUCT_2.size > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        participants = [_value for (_value,) in _STRUCT_2.iter_unpack(buf[offset:offset + _len0 * _STRUCT_2.size])]
+        offset += _len0 * _STRUCT_2.size
+        ip_terms, offset = IPTerms.decode_from(buf, offset)
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        milestones = []
+        for _ in range(_len0):
+            _item0, offset = Milestone.decode_from(buf, offset)
+            milestones.append(_item0)
+        if buf[offset] == 1:
+            offset += 1
+            metadata_hash = _STRUCT_2.unpack_from(buf, offset)[0]
+            offset += _STRUCT_2.size
+        elif buf[offset] == 0:
+            offset += 1
+            metadata_hash = None
+        else:
+            raise ValueError(f'Invalid option tag at offset {offset}')
+        return cls(is_initialized, owner, title, description, status, funding_goal, funds_raised, participants, ip_terms, milestones, metadata_hash), offset
+
+
+class ProjectStatus(enum.IntEnum):
+    Draft = 0
+    Active = 1
+    PendingReview = 2
+    Completed = 3
+    Disputed = 4
+
+
+class IPTerms(_Codec):
+    __slots__ = ('ownership_split', 'license_type', 'commercial_rights')
+
+    def __init__(self, ownership_split, license_type, commercial_rights):
+        self.ownership_split = ownership_split
+        self.license_type = license_type
+        self.commercial_rights = commercial_rights
+
+    def encoded_size(self):
+        return 4 + len(self.ownership_split) * _STRUCT_3.size + 4 + len(self.license_type.encode('utf-8')) + _STRUCT_4.size
+
+    def encode_into(self, buf, offset):
+        _U32.pack_into(buf, offset, len(self.ownership_split))
+        offset += 4
+        for _item0 in self.ownership_split:
+            if len(_item0[0]) != 32:
+                raise ValueError(f'Expected 32 bytes, got {len(_item0[0])}')
+            _STRUCT_3.pack_into(buf, offset, *_item0)
+            offset += _STRUCT_3.size
+        _raw0 = self.license_type.encode('utf-8')
+        _U32.pack_into(buf, offset, len(_raw0))
+        offset += 4
+        buf[offset:offset + len(_raw0)] = _raw0
+        offset += len(_raw0)
+        _STRUCT_4.pack_into(buf, offset, self.commercial_rights)
+        offset += _STRUCT_4.size
+        return offset
+
+    @classmethod
+    def decode_from(cls, buf, offset=0):
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 * _STRUCT_3.size > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        ownership_split = list(_STRUCT_3.iter_unpack(buf[offset:offset + _len0 * _STRUCT_3.size]))
+        offset += _len0 * _STRUCT_3.size
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        license_type = str(buf[offset:offset + _len0], 'utf-8')
+        offset += _len0
+        commercial_rights, = _STRUCT_4.unpack_from(buf, offset)
+        if buf[offset] > 1:
+            raise ValueError(f'Invalid bool at offset {offset}')
+        offset += _STRUCT_4.size
+        return cls(ownership_split, license_type, commercial_rights), offset
+
+
+class Milestone(_Codec):
+    __slots__ = ('title', 'description', 'deadline', 'reward', 'completed')
+
+    def __init__(self, title, description, deadline, reward, completed):
+        self.title = title
+        self.description = description
+        self.deadline = deadline
+        self.reward = reward
+        self.completed = completed
+
+    def encoded_size(self):
+        return 4 + len(self.title.encode('utf-8')) + 4 + len(self.description.encode('utf-8')) + _STRUCT_5.size
+
+    def encode_into(self, buf, offset):
+        _raw0 = self.title.encode('utf-8')
+        _U32.pack_into(buf, offset, len(_raw0))
+        offset += 4
+        buf[offset:offset + len(_raw0)] = _raw0
+        offset += len(_raw0)
+        _raw0 = self.description.encode('utf-8')
+        _U32.pack_into(buf, offset, len(_raw0))
+        offset += 4
+        buf[offset:offset + len(_raw0)] = _raw0
+        offset += len(_raw0)
+        _STRUCT_5.pack_into(buf, offset, self.deadline, self.reward, self.completed)
+        offset += _STRUCT_5.size
+        return offset
+
+    @classmethod
+    def decode_from(cls, buf, offset=0):
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        title = str(buf[offset:offset + _len0], 'utf-8')
+        offset += _len0
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        description = str(buf[offset:offset + _len0], 'utf-8')
+        offset += _len0
+        deadline, reward, completed = _STRUCT_5.unpack_from(buf, offset)
+        if buf[offset + 16] > 1:
+            raise ValueError(f'Invalid bool at offset {offset + 16}')
+        offset += _STRUCT_5.size
+        return cls(title, description, deadline, reward, completed), offset
+
+
+class FundingReceipt(_Codec):
+    __slots__ = ('is_initialized', 'project', 'funder', 'pending', 'total_contributed', 'bump')
+
+    def __init__(self, is_initialized, project, funder, pending, total_contributed, bump):
+        self.is_initialized = is_initialized
+        self.project = project
+        self.funder = funder
+        self.pending = pending
+        self.total_contributed = total_contributed
+        self.bump = bump
+
+    def encoded_size(self):
+        return _STRUCT_6.size
+
+    def encode_into(self, buf, offset):
+        if len(self.project) != 32:
+            raise ValueError(f'Expected 32 bytes, got {len(self.project)}')
+        if len(self.funder) != 32:
+            raise ValueError(f'Expected 32 bytes, got {len(self.funder)}')
+        _STRUCT_6.pack_into(buf, offset, self.is_initialized, self.project, self.funder, self.pending, self.total_contributed, self.bump)
+        offset += _STRUCT_6.size
+        return offset
+
+    @classmethod
+    def decode_from(cls, buf, offset=0):
+        is_initialized, project, funder, pending, total_contributed, bump = _STRUCT_6.unpack_from(buf, offset)
+        if buf[offset] > 1:
+            raise ValueError(f'Invalid bool at offset {offset}')
+        offset += _STRUCT_6.size
+        return cls(is_initialized, project, funder, pending, total_contributed, bump), offset
+
+
+class DapprInstruction(_Codec):
+    __slots__ = ()
+    VARIANT = None
+
+    @classmethod
+    def decode_from(cls, buf, offset=0):
+        return _DAPPRINSTRUCTION_VARIANTS[buf[offset]].decode_variant(buf, offset + 1)
+
+
+class DapprInstructionCreateProject(DapprInstruction):
+    __slots__ = ('title', 'description', 'funding_goal', 'ip_terms')
+    VARIANT = 0
+
+    def __init__(self, title, description, funding_goal, ip_terms):
+        self.title = title
+        self.description = description
+        self.funding_goal = funding_goal
+        self.ip_terms = ip_terms
+
+    def encoded_size(self):
+        return 1 + 4 + len(self.title.encode('utf-8')) + 4 + len(self.description.encode('utf-8')) + _STRUCT_7.size + self.ip_terms.encoded_size()
+
+    def encode_into(self, buf, offset):
+        buf[offset] = 0
+        offset += 1
+        _raw0 = self.title.encode('utf-8')
+        _U32.pack_into(buf, offset, len(_raw0))
+        offset += 4
+        buf[offset:offset + len(_raw0)] = _raw0
+        offset += len(_raw0)
+        _raw0 = self.description.encode('utf-8')
+        _U32.pack_into(buf, offset, len(_raw0))
+        offset += 4
+        buf[offset:offset + len(_raw0)] = _raw0
+        offset += len(_raw0)
+        _STRUCT_7.pack_into(buf, offset, self.funding_goal)
+        offset += _STRUCT_7.size
+        offset = self.ip_terms.encode_into(buf, offset)
+        return offset
+
+    @classmethod
+    def decode_variant(cls, buf, offset):
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        title = str(buf[offset:offset + _len0], 'utf-8')
+        offset += _len0
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        description = str(buf[offset:offset + _len0], 'utf-8')
+        offset += _len0
+        funding_goal, = _STRUCT_7.unpack_from(buf, offset)
+        offset += _STRUCT_7.size
+        ip_terms, offset = IPTerms.decode_from(buf, offset)
+        return cls(title, description, funding_goal, ip_terms), offset
+
+
+class DapprInstructionFundProject(DapprInstruction):
+    __slots__ = ('amount',)
+    VARIANT = 1
+
+    def __init__(self, amount):
+        self.amount = amount
+
+    def encoded_size(self):
+        return 1 + _STRUCT_7.size
+
+    def encode_into(self, buf, offset):
+        buf[offset] = 1
+        offset += 1
+        _STRUCT_7.pack_into(buf, offset, self.amount)
+        offset += _STRUCT_7.size
+        return offset
+
+    @classmethod
+    def decode_variant(cls, buf, offset):
+        amount, = _STRUCT_7.unpack_from(buf, offset)
+        offset += _STRUCT_7.size
+        return cls(amount), offset
+
+
+class DapprInstructionAddMilestone(DapprInstruction):
+    __slots__ = ('title', 'description', 'deadline', 'reward')
+    VARIANT = 2
+
+    def __init__(self, title, description, deadline, reward):
+        self.title = title
+        self.description = description
+        self.deadline = deadline
+        self.reward = reward
+
+    def encoded_size(self):
+        return 1 + 4 + len(self.title.encode('utf-8')) + 4 + len(self.description.encode('utf-8')) + _STRUCT_8.size
+
+    def encode_into(self, buf, offset):
+        buf[offset] = 2
+        offset += 1
+        _raw0 = self.title.encode('utf-8')
+        _U32.pack_into(buf, offset, len(_raw0))
+        offset += 4
+        buf[offset:offset + len(_raw0)] = _raw0
+        offset += len(_raw0)
+        _raw0 = self.description.encode('utf-8')
+        _U32.pack_into(buf, offset, len(_raw0))
+        offset += 4
+        buf[offset:offset + len(_raw0)] = _raw0
+        offset += len(_raw0)
+        _STRUCT_8.pack_into(buf, offset, self.deadline, self.reward)
+        offset += _STRUCT_8.size
+        return offset
+
+    @classmethod
+    def decode_variant(cls, buf, offset):
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        title = str(buf[offset:offset + _len0], 'utf-8')
+        offset += _len0
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        description = str(buf[offset:offset + _len0], 'utf-8')
+        offset += _len0
+        deadline, reward = _STRUCT_8.unpack_from(buf, offset)
+        offset += _STRUCT_8.size
+        return cls(title, description, deadline, reward), offset
+
+
+class DapprInstructionCompleteMilestone(DapprInstruction):
+    __slots__ = ('milestone_index',)
+    VARIANT = 3
+
+    def __init__(self, milestone_index):
+        self.milestone_index = milestone_index
+
+    def encoded_size(self):
+        return 1 + _STRUCT_9.size
+
+    def encode_into(self, buf, offset):
+        buf[offset] = 3
+        offset += 1
+        _STRUCT_9.pack_into(buf, offset, self.milestone_index)
+        offset += _STRUCT_9.size
+        return offset
+
+    @classmethod
+    def decode_variant(cls, buf, offset):
+        milestone_index, = _STRUCT_9.unpack_from(buf, offset)
+        offset += _STRUCT_9.size
+        return cls(milestone_index), offset
+
+
+class DapprInstructionDisputeResolution(DapprInstruction):
+    __slots__ = ('resolution',)
+    VARIANT = 4
+
+    def __init__(self, resolution):
+        self.resolution = resolution
+
+    def encoded_size(self):
+        return 1 + 4 + len(self.resolution.encode('utf-8'))
+
+    def encode_into(self, buf, offset):
+        buf[offset] = 4
+        offset += 1
+        _raw0 = self.resolution.encode('utf-8')
+        _U32.pack_into(buf, offset, len(_raw0))
+        offset += 4
+        buf[offset:offset + len(_raw0)] = _raw0
+        offset += len(_raw0)
+        return offset
+
+    @classmethod
+    def decode_variant(cls, buf, offset):
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        resolution = str(buf[offset:offset + _len0], 'utf-8')
+        offset += _len0
+        return cls(resolution), offset
+
+
+class DapprInstructionFundProjectDeferred(DapprInstruction):
+    __slots__ = ('amount',)
+    VARIANT = 5
+
+    def __init__(self, amount):
+        self.amount = amount
+
+    def encoded_size(self):
+        return 1 + _STRUCT_7.size
+
+    def encode_into(self, buf, offset):
+        buf[offset] = 5
+        offset += 1
+        _STRUCT_7.pack_into(buf, offset, self.amount)
+        offset += _STRUCT_7.size
+        return offset
+
+    @classmethod
+    def decode_variant(cls, buf, offset):
+        amount, = _STRUCT_7.unpack_from(buf, offset)
+        offset += _STRUCT_7.size
+        return cls(amount), offset
+
+
+class DapprInstructionAggregateFunding(DapprInstruction):
+    __slots__ = ()
+    VARIANT = 6
+
+    def encoded_size(self):
+        return 1
+
+    def encode_into(self, buf, offset):
+        buf[offset] = 6
+        offset += 1
+        return offset
+
+    @classmethod
+    def decode_variant(cls, buf, offset):
+        return cls(), offset
+
+
+class DapprInstructionCreateProjectCompact(DapprInstruction):
+    __slots__ = ('title', 'funding_goal', 'metadata_hash')
+    VARIANT = 7
+
+    def __init__(self, title, funding_goal, metadata_hash):
+        self.title = title
+        self.funding_goal = funding_goal
+        self.metadata_hash = metadata_hash
+
+    def encoded_size(self):
+        return 1 + 4 + len(self.title.encode('utf-8')) + _STRUCT_10.size
+
+    def encode_into(self, buf, offset):
+        buf[offset] = 7
+        offset += 1
+        _raw0 = self.title.encode('utf-8')
+        _U32.pack_into(buf, offset, len(_raw0))
+        offset += 4
+        buf[offset:offset + len(_raw0)] = _raw0
+        offset += len(_raw0)
+        if len(self.metadata_hash) != 32:
+            raise ValueError(f'Expected 32 bytes, got {len(self.metadata_hash)}')
+        _STRUCT_10.pack_into(buf, offset, self.funding_goal, self.metadata_hash)
+        offset += _STRUCT_10.size
+        return offset
+
+    @classmethod
+    def decode_variant(cls, buf, offset):
+        _len0 = _U32.unpack_from(buf, offset)[0]
+        offset += 4
+        if offset + _len0 > len(buf):
+            raise ValueError(f'Length {_len0} at offset {offset - 4} overruns the buffer')
+        title = str(buf[offset:offset + _len0], 'utf-8')
+        offset += _len0
+        funding_goal, metadata_hash = _STRUCT_10.unpack_from(buf, offset)
+        offset += _STRUCT_10.size
+        return cls(title, funding_goal, metadata_hash), offset
+
+
+DapprInstruction.CreateProject = DapprInstructionCreateProject
+DapprInstruction.FundProject = DapprInstructionFundProject
+DapprInstruction.AddMilestone = DapprInstructionAddMilestone
+DapprInstruction.CompleteMilestone = DapprInstructionCompleteMilestone
+DapprInstruction.DisputeResolution = DapprInstructionDisputeResolution
+DapprInstruction.FundProjectDeferred = DapprInstructionFundProjectDeferred
+DapprInstruction.AggregateFunding = DapprInstructionAggregateFunding
+DapprInstruction.CreateProjectCompact = DapprInstructionCreateProjectCompact
+_DAPPRINSTRUCTION_VARIANTS = (
+    DapprInstructionCreateProject,
+    DapprInstructionFundProject,
+    DapprInstructionAddMilestone,
+    DapprInstructionCompleteMilestone,
+    DapprInstructionDisputeResolution,
+    DapprInstructionFundProjectDeferred,
+    DapprInstructionAggregateFunding,
+    DapprInstructionCreateProjectCompact,
+)
@@ -4,17 +4,54 @@ DAPPR Client for interacting with the DAPPR smart contracts on Solana
 from solana.rpc.api import Client
 from solana.keypair import Keypair
 from solana.publickey import PublicKey
-from solana.transaction import Transaction
-from solana.system_program import CreateAccountParams, create_account
+from solana.transaction import AccountMeta, Transaction, TransactionInstruction
+from solana.system_program import SYS_PROGRAM_ID, CreateAccountParams, create_account
+from solana.rpc.types import DataSliceOpts, MemcmpOpts
 from solana.sysvar import SYSVAR_RENT_PUBKEY
+import asyncio
 import base64
 import json
+import logging
+from typing import Iterator, List, Optional, Tuple, Union
+
+from contracts.fees import (
+    BLOCKHASH_EXPIRY,
+    PriorityFeeEstimator,
+    send_with_fee_bump,
+    set_compute_unit_limit,
+    set_compute_unit_price,
+)
+from contracts.layout import (
+    COMPACT_PROJECT_ACCOUNT_SIZE,
+    PROJECT_ACCOUNT_SIZE,
+    RECEIPT_ACCOUNT_SIZE,
+    RECEIPT_PROJECT_OFFSET,
+    RECEIPT_SEED,
+    decode_project,
+    decode_receipt,
+    encode_add_milestone,
+    encode_aggregate_funding,
+    encode_create_project_compact,
+    encode_fund_project_deferred,
+)
+from contracts.search import PartialProject, SearchIndex
+from contracts.storage import MetadataStore
+
+logger = logging.getLogger(__name__)
 
 # Import the generated IDL (Interface Definition Language) from the compiled program
 # This would be generated by the Solana CLI after building the program
 
 class DapprClient:
-    def __init__(self, rpc_url: str, program_id: str, wallet: Keypair):
+    def __init__(
+        self,
+        rpc_url: str,
+        program_id: str,
+        wallet: Keypair,
+        latency_target: str = "normal",
+        compute_unit_limit: int = 200_000,
+        metadata_store: Optional[MetadataStore] = None
+    ):
         """
         Initialize the DAPPR client
         
@@ -22,10 +59,16 @@ class DapprClient:
             rpc_url: URL of the Solana RPC endpoint
             program_id: Public key of the deployed DAPPR program
             wallet: Keypair of the wallet to use for transactions
+            latency_target: Confirmation latency target ("fast", "normal" or "cheap")
+            compute_unit_limit: Compute units requested per transaction
+            metadata_store: Off-chain store for compact project metadata
         """
         self.client = Client(rpc_url)
         self.program_id = PublicKey(program_id)
         self.wallet = wallet
+        self.compute_unit_limit = compute_unit_limit
+        self.fee_estimator = PriorityFeeEstimator(rpc_url, target=latency_target)
+        self.metadata_store = metadata_store
     
     async def create_project(
         self,
@@ -50,16 +93,13 @@ class DapprClient:
         project_keypair = Keypair()
         
         # Calculate space required for the project account
-        space = 1024  # Adjust based on actual size needed
+        space = PROJECT_ACCOUNT_SIZE
         
         # Get minimum rent exemption
-        rent = self.client.get_minimum_balance_for_rent_exemption(space)
-        
-        # Create the transaction
-        transaction = Transaction()
+        rent = await asyncio.to_thread(self.client.get_minimum_balance_for_rent_exemption, space)
         
         # Add instruction to create the account
-        transaction.add(
+        instructions = [
             create_account(
                 CreateAccountParams(
                     from_pubkey=self.wallet.public_key,
@@ -69,20 +109,131 @@ class DapprClient:
                     program_id=self.program_id,
                 )
             )
-        )
+        ]
         
         # Add instruction to initialize the project
         # This would be replaced with actual program instruction
-        # transaction.add(...)
+        # instructions.append(...)
         
         # Sign and send the transaction
-        result = self.client.send_transaction(
-            transaction,
-            self.wallet,
-            project_keypair  # New account keypair needs to sign
+        return await self._send_prioritized(
+            instructions,
+            [self.wallet, project_keypair],  # New account keypair needs to sign
+            writable_accounts=[self.wallet.public_key, project_keypair.public_key, self.program_id]
         )
+    
+    async def create_project_compact(
+        self,
+        title: str,
+        description: str,
+        funding_goal: int,
+        ip_terms: dict
+    ) -> str:
+        """
+        Create a research project whose description and IP terms are stored off chain
+        
+        The metadata is written to the metadata store and only its 32-byte
+        content hash is kept in the project account.
+        
+        Args:
+            title: Project title
+            description: Project description
+            funding_goal: Funding goal in lamports
+            ip_terms: Dictionary containing IP terms
+            
+        Returns:
+            Transaction signature
+        """
+        if self.metadata_store is None:
+            raise ValueError("A metadata store is required to create compact projects")
+        metadata_hash = self.metadata_store.put(description, ip_terms)
         
-        return result['result']
+        # Generate a new keypair for the project account
+        project_keypair = Keypair()
+        space = COMPACT_PROJECT_ACCOUNT_SIZE
+        rent = await asyncio.to_thread(self.client.get_minimum_balance_for_rent_exemption, space)
+        
+        instructions = [
+            create_account(
+                CreateAccountParams(
+                    from_pubkey=self.wallet.public_key,
+                    new_account_pubkey=project_keypair.public_key,
+                    lamports=rent,
+                    space=space,
+                    program_id=self.program_id,
+                )
+            ),
+            TransactionInstruction(
+                keys=[
+                    AccountMeta(pubkey=project_keypair.public_key, is_signer=True, is_writable=True),
+                    AccountMeta(pubkey=self.wallet.public_key, is_signer=True, is_writable=True),
+                    AccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
+                ],
+                program_id=self.program_id,
+                data=encode_create_project_compact(title, funding_goal, metadata_hash)
+            ),
+        ]
+        
+        return await self._send_prioritized(
+            instructions,
+            [self.wallet, project_keypair],  # New account keypair needs to sign
+            writable_accounts=[self.wallet.public_key, project_keypair.public_key, self.program_id]
+        )
+    
+    async def _send_prioritized(
+        self,
+        instructions: List[TransactionInstruction],
+        signers: List[Keypair],
+        writable_accounts: List[PublicKey],
+        resubmit: bool = True
+    ) -> str:
+        """
+        Send instructions with a priority fee, bumping the fee if confirmation stalls
+        
+        Args:
+            instructions: Instructions to include in the transaction
+            signers: Keypairs that sign the transaction, fee payer first
+            writable_accounts: Accounts the transaction write-locks
+            resubmit: Resubmit with a higher fee if confirmation stalls. Every
+                resubmission is a separate transaction that can also land, so
+                this must be off for instructions that move value.
+            
+        Returns:
+            Transaction signature
+        """
+        # Price the transaction from recent fees paid for the accounts it write-locks,
+        # sampling the RPC off the event loop
+        price = await asyncio.to_thread(self.fee_estimator.estimate, writable_accounts)
+        
+        def build_transaction(compute_unit_price: int) -> Transaction:
+            transaction = Transaction()
+            
+            # Add compute-budget instructions so the transaction is prioritized
+            transaction.add(set_compute_unit_limit(self.compute_unit_limit))
+            transaction.add(set_compute_unit_price(compute_unit_price))
+            
+            for instruction in instructions:
+                transaction.add(instruction)
+            return transaction
+        
+        if not resubmit:
+            # Send once and wait until the blockhash has expired before giving up
+            return await send_with_fee_bump(
+                self.client,
+                build_transaction,
+                signers,
+                initial_price=price,
+                confirm_timeout=BLOCKHASH_EXPIRY,
+                max_attempts=1
+            )
+        
+        return await send_with_fee_bump(
+            self.client,
+            build_transaction,
+            signers,
+            initial_price=price,
+            max_price=self.fee_estimator.max_price
+        )
     
     async def fund_project(self, project_pubkey: str, amount: int) -> str:
         """
@@ -100,6 +251,133 @@ class DapprClient:
         # 2. Send transaction
         pass
     
+    def find_receipt_address(self, project_pubkey: str, funder: PublicKey) -> PublicKey:
+        """
+        Derive the address of a funder's receipt account for a project
+        
+        Args:
+            project_pubkey: Public key of the project
+            funder: Public key of the funder
+            
+        Returns:
+            Address of the receipt PDA
+        """
+        address, _ = PublicKey.find_program_address(
+            [RECEIPT_SEED, bytes(PublicKey(project_pubkey)), bytes(funder)],
+            self.program_id
+        )
+        return address
+    
+    async def fund_project_deferred(self, project_pubkey: str, amount: int) -> str:
+        """
+        Fund a project through the wallet's receipt account
+        
+        The project account is only read, so contributions from different funders
+        do not contend for it. The amount is counted in `funds_raised` once
+        `aggregate_funding` folds the receipt into the project.
+        
+        Args:
+            project_pubkey: Public key of the project
+            amount: Amount to fund in lamports
+            
+        Returns:
+            Transaction signature
+        """
+        receipt = self.find_receipt_address(project_pubkey, self.wallet.public_key)
+        instruction = TransactionInstruction(
+            keys=[
+                AccountMeta(pubkey=self.wallet.public_key, is_signer=True, is_writable=True),
+                AccountMeta(pubkey=PublicKey(project_pubkey), is_signer=False, is_writable=False),
+                AccountMeta(pubkey=receipt, is_signer=False, is_writable=True),
+                AccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
+            ],
+            program_id=self.program_id,
+            data=encode_fund_project_deferred(amount)
+        )
+        # A stalled contribution is never resubmitted, a second transaction
+        # could land alongside the first and charge the funder twice
+        return await self._send_prioritized(
+            [instruction],
+            [self.wallet],
+            writable_accounts=[self.wallet.public_key, receipt],
+            resubmit=False
+        )
+    
+    def get_pending_receipts(self, project_pubkey: str) -> List[Tuple[str, dict]]:
+        """
+        Fetch the receipt accounts of a project that hold unaggregated contributions
+        
+        Args:
+            project_pubkey: Public key of the project
+            
+        Returns:
+            List of (receipt pubkey, decoded receipt) pairs
+        """
+        result = self.client.get_program_accounts(
+            self.program_id,
+            encoding="base64",
+            data_size=RECEIPT_ACCOUNT_SIZE,
+            memcmp_opts=[MemcmpOpts(offset=RECEIPT_PROJECT_OFFSET, bytes=str(project_pubkey))]
+        )
+        receipts = []
+        for entry in result['result']:
+            receipt = decode_receipt(base64.b64decode(entry['account']['data'][0]))
+            if receipt['pending']:
+                receipts.append((entry['pubkey'], receipt))
+        return receipts
+    
+    async def aggregate_funding(self, project_pubkey: str, batch_size: int = 20) -> List[str]:
+        """
+        Fold all pending receipt contributions into the project's `funds_raised`
+        
+        Args:
+            project_pubkey: Public key of the project
+            batch_size: Number of receipts aggregated per transaction
+            
+        Returns:
+            Transaction signatures, one per batch
+        """
+        project = PublicKey(project_pubkey)
+        pending = await asyncio.to_thread(self.get_pending_receipts, project_pubkey)
+        receipts = [PublicKey(pubkey) for pubkey, _ in pending]
+        signatures = []
+        for start in range(0, len(receipts), batch_size):
+            batch = receipts[start:start + batch_size]
+            instruction = TransactionInstruction(
+                keys=[AccountMeta(pubkey=project, is_signer=False, is_writable=True)] + [
+                    AccountMeta(pubkey=receipt, is_signer=False, is_writable=True)
+                    for receipt in batch
+                ],
+                program_id=self.program_id,
+                data=encode_aggregate_funding()
+            )
+            signatures.append(await self._send_prioritized(
+                [instruction],
+                [self.wallet],
+                writable_accounts=[self.wallet.public_key, project] + batch
+            ))
+        return signatures
+    
+    async def get_funding_total(self, project_pubkey: str) -> dict:
+        """
+        Get the funds raised by a project including contributions not yet aggregated
+        
+        Args:
+            project_pubkey: Public key of the project
+            
+        Returns:
+            Dictionary with the aggregated, pending and total amounts in lamports
+        """
+        # Only funds_raised is needed, which compact projects keep on chain
+        project = await self.get_project_info(project_pubkey, resolve_metadata=False)
+        receipts = await asyncio.to_thread(self.get_pending_receipts, project_pubkey)
+        pending = sum(receipt['pending'] for _, receipt in receipts)
+        return {
+            "aggregated": project['funds_raised'],
+            "pending": pending,
+            "total": project['funds_raised'] + pending,
+        }
+    
     async def add_milestone(
         self,
         project_pubkey: str,
@@ -121,29 +399,159 @@ class DapprClient:
         Returns:
             Transaction signature
         """
-        # Implementation would include:
-        # 1. Create add_milestone instruction
-        # 2. Send transaction
-        pass
+        project = PublicKey(project_pubkey)
+        # The wallet must own the project, and pays the rent if the account has to grow
+        instruction = TransactionInstruction(
+            keys=[
+                AccountMeta(pubkey=project, is_signer=False, is_writable=True),
+                AccountMeta(pubkey=self.wallet.public_key, is_signer=True, is_writable=True),
+                AccountMeta(pubkey=SYS_PROGRAM_ID, is_signer=False, is_writable=False),
+            ],
+            program_id=self.program_id,
+            data=encode_add_milestone(title, description, deadline, reward)
+        )
+        # A resubmission would append the milestone a second time
+        return await self._send_prioritized(
+            [instruction],
+            [self.wallet],
+            writable_accounts=[self.wallet.public_key, project],
+            resubmit=False
+        )
     
-    async def get_project_info(self, project_pubkey: str) -> dict:
+    async def get_project_info(self, project_pubkey: str, resolve_metadata: bool = True) -> dict:
         """
         Get information about a project
         
         Args:
             project_pubkey: Public key of the project
+            resolve_metadata: Fetch the off-chain description and IP terms of compact projects
             
         Returns:
             Dictionary containing project information
         """
-        # Implementation would include:
-        # 1. Fetch account data
-        # 2. Deserialize using Borsh
-        pass
+        # Fetch account data
+        result = await asyncio.to_thread(
+            self.client.get_account_info, PublicKey(project_pubkey), encoding="base64"
+        )
+        account = result['result']['value']
+        if account is None:
+            raise ValueError(f"Project account not found: {project_pubkey}")
+        
+        # Deserialize using Borsh
+        project = decode_project(base64.b64decode(account['data'][0]))
+        if resolve_metadata and project['metadata_hash'] is not None:
+            if self.metadata_store is None:
+                raise ValueError("A metadata store is required to resolve compact projects")
+            project = self.metadata_store.resolve(project)
+        return project
+    
+    def get_project_metadata(self, project: dict) -> dict:
+        """
+        Fetch the off-chain description and IP terms of a compact project
+        
+        Blobs are verified against the on-chain hash and cached by the metadata
+        store, so listings can decode projects without fetching them.
+        
+        Args:
+            project: Project as returned by `get_project_info`
+            
+        Returns:
+            Dictionary with the project description and IP terms
+        """
+        if self.metadata_store is None:
+            raise ValueError("A metadata store is required to resolve compact projects")
+        return self.metadata_store.get(project['metadata_hash'])
+    
+    def iter_project_accounts(self, page_size: int = 100) -> Iterator[Tuple[str, bytes]]:
+        """
+        Scan the chain for all project accounts owned by the DAPPR program
+        
+        Only the account addresses are listed up front, the account data is
+        fetched in pages so a full scan holds at most `page_size` accounts.
+        
+        Args:
+            page_size: Number of accounts fetched per request, at most 100
+            
+        Returns:
+            Iterator of (account pubkey, raw account data) pairs
+        """
+        # Project accounts grow as milestones are added, so they can't be
+        # filtered by size. Receipts are fixed size and skipped instead.
+        result = self.client.get_program_accounts(
+            self.program_id,
+            encoding="base64",
+            data_slice=DataSliceOpts(offset=0, length=0)
+        )
+        pubkeys = [entry['pubkey'] for entry in result['result']]
+        for start in range(0, len(pubkeys), page_size):
+            page = pubkeys[start:start + page_size]
+            result = self.client.get_multiple_accounts(
+                [PublicKey(pubkey) for pubkey in page],
+                encoding="base64"
+            )
+            for pubkey, account in zip(page, result['result']['value']):
+                # Accounts closed since they were listed come back empty
+                if account is None:
+                    continue
+                data = base64.b64decode(account['data'][0])
+                if len(data) != RECEIPT_ACCOUNT_SIZE:
+                    yield pubkey, data
+    
+    def export_snapshot(self, directory: str, chunk_size: int = 10_000) -> int:
+        """
+        Export all projects to a columnar snapshot for offline analytics
+        
+        Args:
+            directory: Directory the snapshot is written to
+            chunk_size: Number of projects per partition file
+            
+        Returns:
+            Number of projects exported
+        """
+        # Imported here so pyarrow is only required when exporting snapshots
+        from contracts.snapshot import export_snapshot
+        
+        return export_snapshot(
+            self.iter_project_accounts(),
+            directory,
+            chunk_size=chunk_size,
+            metadata_store=self.metadata_store
+        )
+    
+    def build_search_index(self, index: Optional[SearchIndex] = None) -> SearchIndex:
+        """
+        Index all projects for full-text search
+        
+        Args:
+            index: Existing index to refresh incrementally, a new one is built if omitted
+            
+        Returns:
+            The up to date search index
+        """
+        if index is None:
+            index = SearchIndex()
+        
+        # The index remembers which account data it was built from, so only
+        # accounts that changed since its last refresh are decoded again
+        index.sync(self.iter_project_accounts(), self._decode_for_index)
+        return index
+    
+    def _decode_for_index(self, data: bytes) -> Union[dict, PartialProject]:
+        project = decode_project(data)
+        if project['metadata_hash'] is None:
+            return project
+        # Index the off-chain description and license of compact projects,
+        # falling back to the on-chain fields until the blob can be resolved
+        if self.metadata_store is None:
+            return PartialProject(project)
+        try:
+            return self.metadata_store.resolve(project)
+        except (KeyError, ValueError) as e:
+            logger.warning("Indexing compact project without its metadata: %s", e)
+            return PartialProject(project)
 
 # Example usage
 if __name__ == "__main__":
-    import asyncio
     from solana.keypair import Keypair
     
     # Example configuration
@@ -159,7 +567,7 @@ if __name__ == "__main__":
     # Example: Create a project
     async def example_create_project():
         ip_terms = {
-            "ownership_split": [str(wallet.public_key), 100],
+            "ownership_split": [(str(wallet.public_key), 100)],
             "license_type": "MIT",
             "commercial_rights": True
         }
@@ -0,0 +1,730 @@
+"""
+Generate Python Borsh codecs from the DAPPR program sources
+
+Reads the Borsh-derived structs and enums in `src/lib.rs` and writes
+`borsh_codecs.py`, a module of precompiled encoder/decoder classes. Runs of
+fixed-size fields are packed with a single `struct.Struct`, encoding fills a
+buffer preallocated to the exact size, and instances use `__slots__`.
+
+Like the Rust deserializer, decoding raises `ValueError` for length prefixes
+that run past the buffer and for bool or option bytes other than 0 and 1.
+Encoding raises `ValueError` for byte arrays of the wrong length, which
+`struct` would otherwise pad or truncate.
+
+Regenerate after changing `lib.rs`:
+
+    python src/contracts/codegen.py
+
+Check that the generated module is up to date, or time it against a generic
+`borsh-construct` schema:
+
+    python src/contracts/codegen.py --check
+    python src/contracts/codegen.py --bench
+
+Round-trip tests live in `tests/test_borsh_codecs.py`.
+"""
+import argparse
+import re
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+CONTRACTS_DIR = Path(__file__).resolve().parent
+SOURCE_PATH = CONTRACTS_DIR / "src" / "lib.rs"
+OUTPUT_PATH = CONTRACTS_DIR / "borsh_codecs.py"
+
+_DERIVE_RE = re.compile(
+    r"#\[derive\(([^)]*)\)\]\s*(?:#\[[^\]]*\]\s*)*pub\s+(struct|enum)\s+(\w+)\s*\{"
+)
+_COMMENT_RE = re.compile(r"//[^\n]*")
+
+# struct module format characters of the fixed-size primitive types
+PRIMITIVES = {
+    "bool": "?",
+    "u8": "B",
+    "i8": "b",
+    "u16": "H",
+    "i16": "h",
+    "u32": "I",
+    "i32": "i",
+    "u64": "Q",
+    "i64": "q",
+    "f32": "f",
+    "f64": "d",
+}
+
+
+# Parsed Rust types
+class Prim(NamedTuple):
+    name: str
+
+
+class Str(NamedTuple):
+    pass
+
+
+class Vec(NamedTuple):
+    item: "RustType"
+
+
+class Opt(NamedTuple):
+    item: "RustType"
+
+
+class Tup(NamedTuple):
+    items: Tuple["RustType", ...]
+
+
+class Bytes(NamedTuple):
+    length: int
+
+
+class Named(NamedTuple):
+    name: str
+
+
+RustType = Union[Prim, Str, Vec, Opt, Tup, Bytes, Named]
+
+
+class Field(NamedTuple):
+    name: str
+    type: RustType
+
+
+class StructDef(NamedTuple):
+    name: str
+    fields: List[Field]
+
+
+class Variant(NamedTuple):
+    name: str
+    fields: List[Field]
+
+
+class EnumDef(NamedTuple):
+    name: str
+    variants: List[Variant]
+
+    @property
+    def is_unit(self) -> bool:
+        return all(not variant.fields for variant in self.variants)
+
+
+def _split_top_level(text: str) -> List[str]:
+    """Split on commas that are not nested inside <>, (), [] or {}"""
+    parts, depth, current = [], 0, []
+    for char in text:
+        if char in "<([{":
+            depth += 1
+        elif char in ">)]}":
+            depth -= 1
+        if char == "," and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append("".join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+def _matching_brace(text: str, start: int) -> int:
+    depth = 0
+    for index in range(start, len(text)):
+        if text[index] == "{":
+            depth += 1
+        elif text[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+    raise ValueError("Unbalanced braces in Rust source")
+
+
+def parse_type(text: str) -> RustType:
+    """
+    Parse a Rust type expression
+
+    Args:
+        text: Type as written in the source, e.g. "Vec<(Pubkey, u8)>"
+
+    Returns:
+        Parsed type
+    """
+    text = text.strip()
+    if text in PRIMITIVES:
+        return Prim(text)
+    if text == "String":
+        return Str()
+    if text == "Pubkey":
+        return Bytes(32)
+    if text.startswith("Vec<") and text.endswith(">"):
+        return Vec(parse_type(text[4:-1]))
+    if text.startswith("Option<") and text.endswith(">"):
+        return Opt(parse_type(text[7:-1]))
+    if text.startswith("(") and text.endswith(")"):
+        return Tup(tuple(parse_type(item) for item in _split_top_level(text[1:-1])))
+    if text.startswith("[") and text.endswith("]"):
+        item, length = text[1:-1].split(";")
+        if item.strip() != "u8":
+            raise NotImplementedError(f"Unsupported array type: {text}")
+        return Bytes(int(length))
+    if re.fullmatch(r"\w+", text):
+        return Named(text)
+    raise NotImplementedError(f"Unsupported type: {text}")
+
+
+def _parse_fields(body: str) -> List[Field]:
+    fields = []
+    for entry in _split_top_level(body):
+        name, type_text = entry.split(":", 1)
+        name = name.replace("pub", "").strip()
+        fields.append(Field(name, parse_type(type_text)))
+    return fields
+
+
+def parse_source(source: str) -> List[Union[StructDef, EnumDef]]:
+    """
+    Extract the Borsh-derived types from Rust source
+
+    Args:
+        source: Contents of lib.rs
+
+    Returns:
+        Struct and enum definitions in source order
+    """
+    source = _COMMENT_RE.sub("", source)
+    definitions = []
+    for match in _DERIVE_RE.finditer(source):
+        derives = {derive.strip() for derive in match.group(1).split(",")}
+        if not {"BorshSerialize", "BorshDeserialize"} <= derives:
+            continue
+        kind, name = match.group(2), match.group(3)
+        start = match.end() - 1
+        body = source[start + 1:_matching_brace(source, start)]
+
+        if kind == "struct":
+            definitions.append(StructDef(name, _parse_fields(body)))
+            continue
+
+        variants = []
+        for entry in _split_top_level(body):
+            if "{" in entry:
+                variant_name, fields = entry.split("{", 1)
+                variants.append(Variant(variant_name.strip(), _parse_fields(fields.rstrip("}"))))
+            elif "(" in entry:
+                raise NotImplementedError(f"Tuple variants are not supported: {name}::{entry}")
+            else:
+                variants.append(Variant(entry.strip(), []))
+        definitions.append(EnumDef(name, variants))
+    return definitions
+
+
+class _Generator:
+    """Emits the source of the codec module"""
+
+    def __init__(self, definitions: List[Union[StructDef, EnumDef]]):
+        self.definitions = {definition.name: definition for definition in definitions}
+        self.order = [definition.name for definition in definitions]
+        self.structs: Dict[str, str] = {}
+        self.lines: List[str] = []
+
+    # Type classification
+
+    def _is_unit_enum(self, rust_type: RustType) -> bool:
+        definition = self.definitions.get(rust_type.name) if isinstance(rust_type, Named) else None
+        return isinstance(definition, EnumDef) and definition.is_unit
+
+    def scalar_format(self, rust_type: RustType) -> Optional[str]:
+        """Format of a type that packs to a single struct value, None otherwise"""
+        if isinstance(rust_type, Prim):
+            return PRIMITIVES[rust_type.name]
+        if isinstance(rust_type, Bytes):
+            return f"{rust_type.length}s"
+        if self._is_unit_enum(rust_type):
+            return "B"
+        return None
+
+    def fixed_format(self, rust_type: RustType) -> Optional[str]:
+        """Format of a fixed-size type, tuples unpack to several values"""
+        if isinstance(rust_type, Tup):
+            formats = [self.scalar_format(item) for item in rust_type.items]
+            return None if None in formats else "".join(formats)
+        return self.scalar_format(rust_type)
+
+    def struct(self, fmt: str) -> str:
+        """Name of the module-level struct.Struct for a format"""
+        fmt = fmt if fmt.startswith("<") else "<" + fmt
+        if fmt not in self.structs:
+            self.structs[fmt] = f"_STRUCT_{len(self.structs)}"
+        return self.structs[fmt]
+
+    def _bool_offsets(self, fmt: str) -> List[int]:
+        """Byte offsets of the bool values packed by a format"""
+        return [struct.calcsize("<" + fmt[:index]) for index, char in enumerate(fmt) if char == "?"]
+
+    def emit_bool_check(self, fmt: str, indent: str) -> None:
+        # struct unpacks any nonzero byte as True, Borsh only accepts 0 and 1
+        for k in self._bool_offsets(fmt):
+            position = f"offset + {k}" if k else "offset"
+            self.lines.append(f"{indent}if buf[{position}] > 1:")
+            self.lines.append(f"{indent}    raise ValueError(f'Invalid bool at offset {{{position}}}')")
+
+    def emit_length_check(self, length: str, size: str, indent: str) -> None:
+        # Slicing past the end silently returns fewer bytes
+        self.lines.append(f"{indent}if offset + {size} > len(buf):")
+        self.lines.append(f"{indent}    raise ValueError(f'Length {{{length}}} at offset {{offset - 4}} overruns the buffer')")
+
+    def emit_bytes_check(self, rust_type: RustType, expr: str, indent: str) -> None:
+        # struct pads short byte strings and truncates long ones
+        if isinstance(rust_type, Bytes):
+            checks = [(expr, rust_type.length)]
+        elif isinstance(rust_type, Tup):
+            checks = [
+                (f"{expr}[{index}]", item.length)
+                for index, item in enumerate(rust_type.items)
+                if isinstance(item, Bytes)
+            ]
+        else:
+            checks = []
+        for value, length in checks:
+            self.lines.append(f"{indent}if len({value}) != {length}:")
+            self.lines.append(f"{indent}    raise ValueError(f'Expected {length} bytes, got {{len({value})}}')")
+
+    def _convert(self, rust_type: RustType, expr: str) -> str:
+        """Wrap a raw unpacked value in its Python type"""
+        if self._is_unit_enum(rust_type):
+            return f"{rust_type.name}({expr})"
+        return expr
+
+    # Size
+
+    def size_expr(self, rust_type: RustType, expr: str, depth: int) -> str:
+        fmt = self.fixed_format(rust_type)
+        if fmt is not None:
+            return f"{self.struct(fmt)}.size"
+        if isinstance(rust_type, Str):
+            return f"4 + len({expr}.encode('utf-8'))"
+        if isinstance(rust_type, Vec):
+            if rust_type.item == Prim("u8"):
+                return f"4 + len({expr})"
+            item_fmt = self.fixed_format(rust_type.item)
+            if item_fmt is not None:
+                return f"4 + len({expr}) * {self.struct(item_fmt)}.size"
+            item = f"_item{depth}"
+            return f"4 + sum({self.size_expr(rust_type.item, item, depth + 1)} for {item} in {expr})"
+        if isinstance(rust_type, Opt):
+            return f"(1 if {expr} is None else 1 + {self.size_expr(rust_type.item, expr, depth + 1)})"
+        if isinstance(rust_type, Tup):
+            sizes = [
+                self.size_expr(item, f"{expr}[{index}]", depth + 1)
+                for index, item in enumerate(rust_type.items)
+            ]
+            return " + ".join(sizes)
+        return f"{expr}.encoded_size()"
+
+    # Encoding
+
+    def emit_encode(self, rust_type: RustType, expr: str, indent: str, depth: int) -> None:
+        emit = self.lines.append
+        fmt = self.fixed_format(rust_type)
+        if fmt is not None:
+            name = self.struct(fmt)
+            args = f"*{expr}" if isinstance(rust_type, Tup) else expr
+            self.emit_bytes_check(rust_type, expr, indent)
+            emit(f"{indent}{name}.pack_into(buf, offset, {args})")
+            emit(f"{indent}offset += {name}.size")
+        elif isinstance(rust_type, Str) or rust_type == Vec(Prim("u8")):
+            raw = f"_raw{depth}"
+            emit(f"{indent}{raw} = {expr}.encode('utf-8')" if isinstance(rust_type, Str) else f"{indent}{raw} = {expr}")
+            emit(f"{indent}_U32.pack_into(buf, offset, len({raw}))")
+            emit(f"{indent}offset += 4")
+            emit(f"{indent}buf[offset:offset + len({raw})] = {raw}")
+            emit(f"{indent}offset += len({raw})")
+        elif isinstance(rust_type, Vec):
+            item = f"_item{depth}"
+            emit(f"{indent}_U32.pack_into(buf, offset, len({expr}))")
+            emit(f"{indent}offset += 4")
+            emit(f"{indent}for {item} in {expr}:")
+            self.emit_encode(rust_type.item, item, indent + "    ", depth + 1)
+        elif isinstance(rust_type, Opt):
+            emit(f"{indent}if {expr} is None:")
+            emit(f"{indent}    buf[offset] = 0")
+            emit(f"{indent}    offset += 1")
+            emit(f"{indent}else:")
+            emit(f"{indent}    buf[offset] = 1")
+            emit(f"{indent}    offset += 1")
+            self.emit_encode(rust_type.item, expr, indent + "    ", depth + 1)
+        elif isinstance(rust_type, Tup):
+            for index, item in enumerate(rust_type.items):
+                self.emit_encode(item, f"{expr}[{index}]", indent, depth + 1)
+        else:
+            emit(f"{indent}offset = {expr}.encode_into(buf, offset)")
+
+    # Decoding
+
+    def emit_decode(self, rust_type: RustType, target: str, indent: str, depth: int) -> None:
+        emit = self.lines.append
+        fmt = self.fixed_format(rust_type)
+        if fmt is not None:
+            name = self.struct(fmt)
+            if isinstance(rust_type, Tup):
+                emit(f"{indent}{target} = {name}.unpack_from(buf, offset)")
+            else:
+                emit(f"{indent}{target} = {self._convert(rust_type, f'{name}.unpack_from(buf, offset)[0]')}")
+            self.emit_bool_check(fmt, indent)
+            emit(f"{indent}offset += {name}.size")
+        elif isinstance(rust_type, Str) or rust_type == Vec(Prim("u8")):
+            length = f"_len{depth}"
+            emit(f"{indent}{length} = _U32.unpack_from(buf, offset)[0]")
+            emit(f"{indent}offset += 4")
+            self.emit_length_check(length, length, indent)
+            if isinstance(rust_type, Str):
+                emit(f"{indent}{target} = str(buf[offset:offset + {length}], 'utf-8')")
+            else:
+                emit(f"{indent}{target} = bytes(buf[offset:offset + {length}])")
+            emit(f"{indent}offset += {length}")
+        elif isinstance(rust_type, Vec):
+            length = f"_len{depth}"
+            emit(f"{indent}{length} = _U32.unpack_from(buf, offset)[0]")
+            emit(f"{indent}offset += 4")
+            item_fmt = self.fixed_format(rust_type.item)
+            if item_fmt is not None and "?" not in item_fmt:
+                # Fixed-size items are unpacked in one pass over the slice
+                name = self.struct(item_fmt)
+                self.emit_length_check(length, f"{length} * {name}.size", indent)
+                chunk = f"buf[offset:offset + {length} * {name}.size]"
+                if isinstance(rust_type.item, Tup):
+                    emit(f"{indent}{target} = list({name}.iter_unpack({chunk}))")
+                else:
+                    value = self._convert(rust_type.item, "_value")
+                    emit(f"{indent}{target} = [{value} for (_value,) in {name}.iter_unpack({chunk})]")
+                emit(f"{indent}offset += {length} * {name}.size")
+            else:
+                item = f"_item{depth}"
+                emit(f"{indent}{target} = []")
+                emit(f"{indent}for _ in range({length}):")
+                self.emit_decode(rust_type.item, item, indent + "    ", depth + 1)
+                emit(f"{indent}    {target}.append({item})")
+        elif isinstance(rust_type, Opt):
+            emit(f"{indent}if buf[offset] == 1:")
+            emit(f"{indent}    offset += 1")
+            self.emit_decode(rust_type.item, target, indent + "    ", depth + 1)
+            emit(f"{indent}elif buf[offset] == 0:")
+            emit(f"{indent}    offset += 1")
+            emit(f"{indent}    {target} = None")
+            emit(f"{indent}else:")
+            emit(f"{indent}    raise ValueError(f'Invalid option tag at offset {{offset}}')")
+        elif isinstance(rust_type, Tup):
+            items = [f"_tup{depth}_{index}" for index in range(len(rust_type.items))]
+            for item, item_type in zip(items, rust_type.items):
+                self.emit_decode(item_type, item, indent, depth + 1)
+            emit(f"{indent}{target} = ({', '.join(items)},)")
+        else:
+            emit(f"{indent}{target}, offset = {rust_type.name}.decode_from(buf, offset)")
+
+    # Field groups
+
+    def _runs(self, fields: List[Field]) -> List[List[Field]]:
+        """Group consecutive scalar fields so each group is packed with one struct"""
+        runs: List[List[Field]] = []
+        for field in fields:
+            scalar = self.scalar_format(field.type) is not None
+            if scalar and runs and self.scalar_format(runs[-1][0].type) is not None:
+                runs[-1].append(field)
+            else:
+                runs.append([field])
+        return runs
+
+    def emit_fields(self, fields: List[Field], variant: Optional[int]) -> None:
+        emit = self.lines.append
+        names = [field.name for field in fields]
+        runs = self._runs(fields)
+
+        slots = ", ".join(repr(name) for name in names)
+        emit(f"    __slots__ = ({slots},)" if len(names) == 1 else f"    __slots__ = ({slots})")
+        if variant is not None:
+            emit(f"    VARIANT = {variant}")
+        emit("")
+
+        if names:
+            emit(f"    def __init__(self, {', '.join(names)}):")
+            for name in names:
+                emit(f"        self.{name} = {name}")
+            emit("")
+
+        # Size of everything up to the first variable-length field is a constant
+        sizes = ["1"] if variant is not None else []
+        for run in runs:
+            if self.scalar_format(run[0].type) is not None:
+                fmt = "".join(self.scalar_format(field.type) for field in run)
+                sizes.append(f"{self.struct(fmt)}.size")
+            else:
+                sizes.append(self.size_expr(run[0].type, f"self.{run[0].name}", 0))
+        emit("    def encoded_size(self):")
+        emit(f"        return {' + '.join(sizes) or '0'}")
+        emit("")
+
+        emit("    def encode_into(self, buf, offset):")
+        if variant is not None:
+            emit(f"        buf[offset] = {variant}")
+            emit("        offset += 1")
+        for run in runs:
+            if self.scalar_format(run[0].type) is not None:
+                name = self.struct("".join(self.scalar_format(field.type) for field in run))
+                args = ", ".join(f"self.{field.name}" for field in run)
+                for field in run:
+                    self.emit_bytes_check(field.type, f"self.{field.name}", "        ")
+                emit(f"        {name}.pack_into(buf, offset, {args})")
+                emit(f"        offset += {name}.size")
+            else:
+                self.emit_encode(run[0].type, f"self.{run[0].name}", "        ", 0)
+        emit("        return offset")
+        emit("")
+
+        emit("    @classmethod")
+        if variant is not None:
+            emit("    def decode_variant(cls, buf, offset):")
+        else:
+            emit("    def decode_from(cls, buf, offset=0):")
+        for run in runs:
+            if self.scalar_format(run[0].type) is not None:
+                fmt = "".join(self.scalar_format(field.type) for field in run)
+                name = self.struct(fmt)
+                targets = ", ".join(field.name for field in run)
+                if len(run) == 1:
+                    targets += ","
+                emit(f"        {targets} = {name}.unpack_from(buf, offset)")
+                self.emit_bool_check(fmt, "        ")
+                emit(f"        offset += {name}.size")
+                for field in run:
+                    converted = self._convert(field.type, field.name)
+                    if converted != field.name:
+                        emit(f"        {field.name} = {converted}")
+            else:
+                self.emit_decode(run[0].type, run[0].name, "        ", 0)
+        emit(f"        return cls({', '.join(names)}), offset")
+        emit("")
+        emit("")
+
+    def emit_definition(self, definition: Union[StructDef, EnumDef]) -> None:
+        emit = self.lines.append
+        if isinstance(definition, StructDef):
+            emit(f"class {definition.name}(_Codec):")
+            self.emit_fields(definition.fields, None)
+        elif definition.is_unit:
+            emit(f"class {definition.name}(enum.IntEnum):")
+            for index, variant in enumerate(definition.variants):
+                emit(f"    {variant.name} = {index}")
+            emit("")
+            emit("")
+        else:
+            emit(f"class {definition.name}(_Codec):")
+            emit("    __slots__ = ()")
+            emit("    VARIANT = None")
+            emit("")
+            emit("    @classmethod")
+            emit("    def decode_from(cls, buf, offset=0):")
+            emit(f"        return _{definition.name.upper()}_VARIANTS[buf[offset]].decode_variant(buf, offset + 1)")
+            emit("")
+            emit("")
+            for index, variant in enumerate(definition.variants):
+                emit(f"class {definition.name}{variant.name}({definition.name}):")
+                self.emit_fields(variant.fields, index)
+            for variant in definition.variants:
+                emit(f"{definition.name}.{variant.name} = {definition.name}{variant.name}")
+            emit(f"_{definition.name.upper()}_VARIANTS = (")
+            for variant in definition.variants:
+                emit(f"    {definition.name}{variant.name},")
+            emit(")")
+            emit("")
+            emit("")
+
+    def generate(self) -> str:
+        for name in self.order:
+            self.emit_definition(self.definitions[name])
+        body = self.lines
+        while body and body[-1] == "":
+            body.pop()
+
+        header = [
+            '"""',
+            "Borsh codecs for the DAPPR program types",
+            "",
+            "Generated by codegen.py from src/lib.rs, do not edit by hand.",
+            '"""',
+            "import enum",
+            "import struct",
+            "",
+            '_U32 = struct.Struct("<I")',
+        ]
+        header += [f'{name} = struct.Struct("{fmt}")' for fmt, name in self.structs.items()]
+        header += [
+            "",
+            "",
+            "class _Codec:",
+            "    __slots__ = ()",
+            "",
+            "    def __eq__(self, other):",
+            "        return type(other) is type(self) and all(",
+            "            getattr(self, name) == getattr(other, name) for name in self.__slots__",
+            "        )",
+            "",
+            "    def __repr__(self):",
+            "        fields = ', '.join(f'{name}={getattr(self, name)!r}' for name in self.__slots__)",
+            "        return f'{type(self).__name__}({fields})'",
+            "",
+            "    def encode(self) -> bytes:",
+            "        buf = bytearray(self.encoded_size())",
+            "        self.encode_into(buf, 0)",
+            "        return bytes(buf)",
+            "",
+            "    @classmethod",
+            "    def decode(cls, data):",
+            "        return cls.decode_from(data, 0)[0]",
+            "",
+            "",
+        ]
+        return "\n".join(header + body) + "\n"
+
+
+def generate(source: str) -> str:
+    """
+    Generate the codec module for Rust source
+
+    Args:
+        source: Contents of lib.rs
+
+    Returns:
+        Python source of the codec module
+    """
+    return _Generator(parse_source(source)).generate()
+
+
+def construct_schema(definitions: List[Union[StructDef, EnumDef]], name: str):
+    """
+    Build a generic borsh-construct schema for a type, used as the benchmark baseline
+
+    Args:
+        definitions: Parsed type definitions
+        name: Name of the type to build a schema for
+
+    Returns:
+        borsh-construct schema
+    """
+    import borsh_construct as bc
+    from construct import Bytes as FixedBytes
+
+    by_name = {definition.name: definition for definition in definitions}
+    primitives = {
+        "bool": bc.Bool, "u8": bc.U8, "i8": bc.I8, "u16": bc.U16, "i16": bc.I16,
+        "u32": bc.U32, "i32": bc.I32, "u64": bc.U64, "i64": bc.I64, "f32": bc.F32, "f64": bc.F64,
+    }
+
+    def schema(rust_type):
+        if isinstance(rust_type, Prim):
+            return primitives[rust_type.name]
+        if isinstance(rust_type, Str):
+            return bc.String
+        if isinstance(rust_type, Bytes):
+            return FixedBytes(rust_type.length)
+        if isinstance(rust_type, Vec):
+            return bc.Vec(schema(rust_type.item))
+        if isinstance(rust_type, Opt):
+            return bc.Option(schema(rust_type.item))
+        if isinstance(rust_type, Tup):
+            return bc.TupleStruct(*(schema(item) for item in rust_type.items))
+        return named(rust_type.name)
+
+    def named(type_name):
+        definition = by_name[type_name]
+        if isinstance(definition, StructDef):
+            return bc.CStruct(*(field.name / schema(field.type) for field in definition.fields))
+        return bc.Enum(
+            *(
+                variant.name / bc.CStruct(*(field.name / schema(field.type) for field in variant.fields))
+                if variant.fields else variant.name
+                for variant in definition.variants
+            ),
+            enum_name=type_name,
+        )
+
+    return named(name)
+
+
+def _bench() -> None:
+    """Time the generated codecs against borsh-construct"""
+    import timeit
+
+    sys.path.insert(0, str(CONTRACTS_DIR.parent))
+    from contracts import borsh_codecs as codecs
+
+    owner = bytes(range(32))
+    project = codecs.ResearchProject(
+        is_initialized=True,
+        owner=owner,
+        title="Scalable zero-knowledge proofs for research data",
+        description="Lorem ipsum dolor sit amet " * 30,
+        status=codecs.ProjectStatus.Active,
+        funding_goal=1_000_000_000,
+        funds_raised=250_000_000,
+        participants=[owner] * 5,
+        ip_terms=codecs.IPTerms(
+            ownership_split=[(owner, 20)] * 5,
+            license_type="MIT",
+            commercial_rights=True,
+        ),
+        milestones=[
+            codecs.Milestone(
+                title=f"Milestone {index}",
+                description="Deliverable",
+                deadline=1_700_000_000 + index,
+                reward=10_000_000,
+                completed=index % 2 == 0,
+            )
+            for index in range(5)
+        ],
+        metadata_hash=bytes(32),
+    )
+    data = project.encode()
+    generated_decode = timeit.timeit(lambda: codecs.ResearchProject.decode(data), number=10_000)
+    generated_encode = timeit.timeit(project.encode, number=10_000)
+    print(f"generated        decode {generated_decode * 100:.2f} us  encode {generated_encode * 100:.2f} us")
+
+    try:
+        schema = construct_schema(parse_source(SOURCE_PATH.read_text()), "ResearchProject")
+    except ImportError:
+        print("borsh-construct is not installed, skipping the baseline")
+        return
+
+    parsed = schema.parse(data)
+    construct_decode = timeit.timeit(lambda: schema.parse(data), number=1_000) * 10
+    construct_encode = timeit.timeit(lambda: schema.build(parsed), number=1_000) * 10
+    print(f"borsh-construct  decode {construct_decode * 100:.2f} us  encode {construct_encode * 100:.2f} us")
+    print(f"speedup          decode {construct_decode / generated_decode:.1f}x  "
+          f"encode {construct_encode / generated_encode:.1f}x")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="fail if borsh_codecs.py is out of date")
+    parser.add_argument("--bench", action="store_true", help="benchmark the codecs against borsh-construct")
+    args = parser.parse_args()
+
+    if args.bench:
+        _bench()
+        return 0
+
+    generated = generate(SOURCE_PATH.read_text())
+    if args.check:
+        if not OUTPUT_PATH.exists() or OUTPUT_PATH.read_text() != generated:
+            print(f"{OUTPUT_PATH.name} is out of date, run codegen.py", file=sys.stderr)
+            return 1
+        return 0
+
+    OUTPUT_PATH.write_text(generated)
+    print(f"Wrote {OUTPUT_PATH.relative_to(CONTRACTS_DIR)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
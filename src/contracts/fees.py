@@ -0,0 +1,322 @@
+"""
+Priority-fee estimation for DAPPR transactions
+
+Samples `getRecentPrioritizationFees` for the accounts a transaction write-locks,
+keeps a rolling window of observed fees per account set and turns a latency
+target into a compute-unit price. Also provides a fee-bumping resubmission loop for
+transactions whose confirmation stalls.
+"""
+import asyncio
+import bisect
+import logging
+import struct
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Deque, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+import requests
+from solana.publickey import PublicKey
+from solana.rpc.core import RPCException
+from solana.transaction import Transaction, TransactionInstruction
+
+logger = logging.getLogger(__name__)
+
+COMPUTE_BUDGET_PROGRAM_ID = PublicKey("ComputeBudget111111111111111111111111111111")
+
+# Percentile of recently paid fees to match for each latency target
+LATENCY_TARGETS = {
+    "fast": 90,
+    "normal": 50,
+    "cheap": 25,
+}
+
+# Seconds until a transaction's blockhash expires, 150 slots at ~400 ms plus slack
+BLOCKHASH_EXPIRY = 90.0
+
+# Compute-budget instruction discriminators
+_SET_COMPUTE_UNIT_LIMIT = struct.Struct("<BI")
+_SET_COMPUTE_UNIT_PRICE = struct.Struct("<BQ")
+
+
+def set_compute_unit_limit(units: int) -> TransactionInstruction:
+    """
+    Build a ComputeBudget instruction capping the compute units of a transaction
+
+    Args:
+        units: Maximum compute units the transaction may consume
+
+    Returns:
+        The SetComputeUnitLimit instruction
+    """
+    return TransactionInstruction(
+        keys=[],
+        program_id=COMPUTE_BUDGET_PROGRAM_ID,
+        data=_SET_COMPUTE_UNIT_LIMIT.pack(2, units),
+    )
+
+
+def set_compute_unit_price(micro_lamports: int) -> TransactionInstruction:
+    """
+    Build a ComputeBudget instruction setting the priority fee of a transaction
+
+    Args:
+        micro_lamports: Price per compute unit in micro-lamports
+
+    Returns:
+        The SetComputeUnitPrice instruction
+    """
+    return TransactionInstruction(
+        keys=[],
+        program_id=COMPUTE_BUDGET_PROGRAM_ID,
+        data=_SET_COMPUTE_UNIT_PRICE.pack(3, micro_lamports),
+    )
+
+
+class _FeeWindow:
+    """Rolling window of the highest fee paid per slot, kept sorted for percentiles"""
+
+    def __init__(self, size: int):
+        self.slots: Deque[int] = deque(maxlen=size)
+        self.fees: List[int] = []
+        self.seen_slots: Dict[int, int] = {}
+        self.last_refresh = float("-inf")
+
+    def observe(self, fees: Iterable[dict]) -> None:
+        for entry in sorted(fees, key=lambda e: e["slot"]):
+            slot = entry["slot"]
+            fee = entry["prioritizationFee"]
+            # The RPC returns the same recent slots on every call, only keep the highest
+            # fee seen per slot so overlapping samples don't skew the distribution
+            previous = self.seen_slots.get(slot)
+            if previous is not None:
+                if fee <= previous:
+                    continue
+                self._remove(previous)
+            else:
+                if len(self.slots) == self.slots.maxlen:
+                    evicted_slot = self.slots.popleft()
+                    self._remove(self.seen_slots.pop(evicted_slot))
+                self.slots.append(slot)
+            self.seen_slots[slot] = fee
+            bisect.insort(self.fees, fee)
+
+    def _remove(self, fee: int) -> None:
+        index = bisect.bisect_left(self.fees, fee)
+        del self.fees[index]
+
+    def percentile(self, pct: float) -> int:
+        if not self.fees:
+            return 0
+        index = min(len(self.fees) - 1, int(len(self.fees) * pct / 100))
+        return self.fees[index]
+
+
+class PriorityFeeEstimator:
+    """Rolling percentile models over recently paid prioritization fees"""
+
+    def __init__(
+        self,
+        rpc_url: str,
+        target: str = "normal",
+        window: int = 600,
+        min_price: int = 1,
+        max_price: int = 5_000_000,
+        refresh_interval: float = 10.0,
+        max_account_sets: int = 256,
+    ):
+        """
+        Initialize the fee estimator
+
+        Fees depend on the accounts a transaction write-locks, so a separate
+        model is kept for every set of accounts that is priced.
+
+        Args:
+            rpc_url: URL of the Solana RPC endpoint
+            target: Default latency target ("fast", "normal" or "cheap")
+            window: Number of fee samples kept in each rolling model
+            min_price: Lowest compute-unit price ever returned, in micro-lamports
+            max_price: Highest compute-unit price ever returned, in micro-lamports
+            refresh_interval: Seconds before a model is resampled from the RPC
+            max_account_sets: Number of account sets whose models are kept
+        """
+        if target not in LATENCY_TARGETS:
+            raise ValueError(f"Unknown latency target: {target}")
+        self.rpc_url = rpc_url
+        self.target = target
+        self.window = window
+        self.min_price = min_price
+        self.max_price = max_price
+        self.refresh_interval = refresh_interval
+        self.max_account_sets = max_account_sets
+        self._windows: "OrderedDict[FrozenSet[str], _FeeWindow]" = OrderedDict()
+
+    def _window(self, accounts: Sequence[PublicKey]) -> _FeeWindow:
+        key = frozenset(str(account) for account in accounts)
+        window = self._windows.get(key)
+        if window is None:
+            window = self._windows[key] = _FeeWindow(self.window)
+            if len(self._windows) > self.max_account_sets:
+                self._windows.popitem(last=False)
+        else:
+            self._windows.move_to_end(key)
+        return window
+
+    def observe(self, accounts: Sequence[PublicKey], fees: Iterable[dict]) -> None:
+        """
+        Feed `getRecentPrioritizationFees` entries into the model of an account set
+
+        Args:
+            accounts: Accounts the fees were sampled for
+            fees: Entries of the form {"slot": int, "prioritizationFee": int}
+        """
+        self._window(accounts).observe(fees)
+
+    def sample(self, accounts: Sequence[PublicKey]) -> None:
+        """
+        Fetch recent prioritization fees for the given write-locked accounts
+
+        Args:
+            accounts: Accounts the transaction will write-lock
+
+        Raises:
+            requests.RequestException: If the RPC request fails
+            ValueError: If the RPC returns an error or an unreadable response
+        """
+        response = requests.post(
+            self.rpc_url,
+            json={
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "getRecentPrioritizationFees",
+                "params": [[str(account) for account in accounts]],
+            },
+            timeout=10,
+        )
+        response.raise_for_status()
+        payload = response.json()
+        if "error" in payload:
+            raise ValueError(f"getRecentPrioritizationFees failed: {payload['error']}")
+        window = self._window(accounts)
+        window.observe(payload.get("result") or [])
+        window.last_refresh = time.monotonic()
+
+    def percentile(self, accounts: Sequence[PublicKey], pct: float) -> int:
+        """
+        Return the given percentile of the fees observed for an account set
+
+        Args:
+            accounts: Accounts the transaction will write-lock
+            pct: Percentile between 0 and 100
+
+        Returns:
+            Fee in micro-lamports per compute unit, 0 if no samples were observed
+        """
+        return self._window(accounts).percentile(pct)
+
+    def estimate(
+        self,
+        accounts: Sequence[PublicKey],
+        target: Optional[str] = None,
+    ) -> int:
+        """
+        Estimate the compute-unit price needed to land within the latency target
+
+        If the RPC cannot be sampled the cached model of the account set is
+        used, which falls back to `min_price` when nothing was observed yet.
+
+        Args:
+            accounts: Accounts the transaction will write-lock
+            target: Latency target, defaults to the estimator's target
+
+        Returns:
+            Compute-unit price in micro-lamports
+        """
+        target = target or self.target
+        if target not in LATENCY_TARGETS:
+            raise ValueError(f"Unknown latency target: {target}")
+        window = self._window(accounts)
+        if time.monotonic() - window.last_refresh >= self.refresh_interval:
+            try:
+                self.sample(accounts)
+            except (requests.RequestException, ValueError) as e:
+                logger.warning("Sampling prioritization fees failed, using the cached model: %s", e)
+                # Don't retry a failing RPC on every transaction
+                window.last_refresh = time.monotonic()
+        price = window.percentile(LATENCY_TARGETS[target])
+        return max(self.min_price, min(self.max_price, price))
+
+
+async def send_with_fee_bump(
+    client,
+    build_transaction: Callable[[int], Transaction],
+    signers: Sequence,
+    initial_price: int,
+    max_price: int = 5_000_000,
+    bump_factor: float = 1.5,
+    confirm_timeout: float = 15.0,
+    poll_interval: float = 0.5,
+    max_attempts: int = 4,
+) -> str:
+    """
+    Send a transaction, resubmitting it with a higher priority fee if it stalls
+
+    Every attempt is a separate transaction, so several of them can land. Only
+    use this for instructions that fail or do nothing when repeated, never for
+    value transfers.
+
+    The client is synchronous, its requests run in a worker thread so the
+    event loop is not blocked while waiting on the RPC.
+
+    Args:
+        client: Solana RPC client
+        build_transaction: Builds a fresh transaction for a compute-unit price
+        signers: Keypairs that sign every attempt
+        initial_price: Compute-unit price of the first attempt, in micro-lamports
+        max_price: Upper bound on the compute-unit price
+        bump_factor: Multiplier applied to the price after each stalled attempt
+        confirm_timeout: Seconds to wait for confirmation before bumping
+        poll_interval: Seconds between signature status polls
+        max_attempts: Number of submissions before giving up
+
+    Returns:
+        Signature of the confirmed transaction
+    """
+    price = initial_price
+    signatures = []
+    errors = {}
+    for _ in range(max_attempts):
+        try:
+            result = await asyncio.to_thread(client.send_transaction, build_transaction(price), *signers)
+        except RPCException as e:
+            if not signatures:
+                raise
+            # A bump is rejected in preflight once an earlier attempt has landed,
+            # e.g. with "account already in use", keep polling the earlier ones
+            logger.warning("Resubmission at %d micro-lamports failed: %s", price, e)
+        else:
+            signatures.append(result['result'])
+
+        deadline = time.monotonic() + confirm_timeout
+        while time.monotonic() < deadline:
+            # Earlier attempts may still land after a bump, check them all
+            response = await asyncio.to_thread(client.get_signature_statuses, signatures)
+            for signature, status in zip(signatures, response['result']['value']):
+                if status is None:
+                    continue
+                if status.get('err') is not None:
+                    errors[signature] = status['err']
+                elif status.get('confirmationStatus') in ("confirmed", "finalized"):
+                    return signature
+            # A bumped attempt can also fail on chain if an earlier one already
+            # landed, so only give up once every attempt has failed
+            if len(errors) == len(signatures):
+                signature = signatures[-1]
+                raise RuntimeError(f"Transaction {signature} failed: {errors[signature]}")
+            await asyncio.sleep(poll_interval)
+
+        price = min(max_price, max(price + 1, int(price * bump_factor)))
+
+    raise TimeoutError(
+        f"Transaction not confirmed after {max_attempts} attempts, "
+        f"it may still land: {', '.join(signatures)}"
+    )
@@ -0,0 +1,171 @@
+"""
+Borsh layouts of the DAPPR program accounts
+
+Wraps the codecs generated from `src/lib.rs` so that account data fetched from
+the chain can be decoded into plain dictionaries, and instructions encoded, on
+the client. Regenerate the codecs with `python src/contracts/codegen.py` after
+changing the program types.
+"""
+import base58
+
+from contracts.borsh_codecs import DapprInstruction, FundingReceipt, IPTerms, Milestone, ProjectStatus, ResearchProject
+
+# Limits enforced by the program, see lib.rs
+MAX_TITLE_LENGTH = 100
+MAX_PARTICIPANTS = 10
+
+# Sizes the client allocates for project accounts. Compact projects keep their
+# description and IP terms off chain, so their accounts are sized for the
+# longest title and the most participants a project can have. Milestones are
+# unbounded, `AddMilestone` grows the account when one no longer fits.
+PROJECT_ACCOUNT_SIZE = 1024
+COMPACT_PROJECT_ACCOUNT_SIZE = ResearchProject(
+    is_initialized=True,
+    owner=bytes(32),
+    title="x" * MAX_TITLE_LENGTH,
+    description="",
+    status=ProjectStatus.Draft,
+    funding_goal=0,
+    funds_raised=0,
+    participants=[bytes(32)] * MAX_PARTICIPANTS,
+    ip_terms=IPTerms(ownership_split=[], license_type="", commercial_rights=False),
+    milestones=[],
+    metadata_hash=bytes(32),
+).encoded_size()
+
+# `FundingReceipt` is fixed size: is_initialized, project, funder, pending, total_contributed, bump
+RECEIPT_ACCOUNT_SIZE = FundingReceipt(False, bytes(32), bytes(32), 0, 0, 0).encoded_size()
+RECEIPT_PROJECT_OFFSET = 1
+RECEIPT_SEED = b"receipt"
+
+# `DapprInstruction` variant indices
+FUND_PROJECT_DEFERRED = DapprInstruction.FundProjectDeferred.VARIANT
+AGGREGATE_FUNDING = DapprInstruction.AggregateFunding.VARIANT
+CREATE_PROJECT_COMPACT = DapprInstruction.CreateProjectCompact.VARIANT
+
+
+def _pubkey(key: bytes) -> str:
+    return base58.b58encode(key).decode("utf-8")
+
+
+def _milestone(milestone: Milestone) -> dict:
+    return {
+        "title": milestone.title,
+        "description": milestone.description,
+        "deadline": milestone.deadline,
+        "reward": milestone.reward,
+        "completed": milestone.completed,
+    }
+
+
+def decode_project(data: bytes) -> dict:
+    """
+    Decode a `ResearchProject` account
+
+    Accounts are allocated with a fixed size, so the encoded project is usually
+    followed by zero padding that is left unread.
+
+    Args:
+        data: Raw account data
+
+    Returns:
+        Dictionary containing project information
+    """
+    # Accounts written before `metadata_hash` existed may end right after the
+    # milestones, the extra zero byte decodes the missing hash as None
+    decoded = ResearchProject.decode(bytes(data) + b"\x00")
+    ip_terms = decoded.ip_terms
+    return {
+        "is_initialized": decoded.is_initialized,
+        "owner": _pubkey(decoded.owner),
+        "title": decoded.title,
+        "description": decoded.description,
+        "status": decoded.status.name,
+        "funding_goal": decoded.funding_goal,
+        "funds_raised": decoded.funds_raised,
+        "participants": [_pubkey(participant) for participant in decoded.participants],
+        "ip_terms": {
+            "ownership_split": [(_pubkey(key), percentage) for key, percentage in ip_terms.ownership_split],
+            "license_type": ip_terms.license_type,
+            "commercial_rights": ip_terms.commercial_rights,
+        },
+        "milestones": [_milestone(milestone) for milestone in decoded.milestones],
+        "metadata_hash": decoded.metadata_hash,
+    }
+
+
+def decode_receipt(data: bytes) -> dict:
+    """
+    Decode a `FundingReceipt` account
+
+    Args:
+        data: Raw account data
+
+    Returns:
+        Dictionary containing receipt information
+    """
+    receipt = FundingReceipt.decode(data)
+    return {
+        "is_initialized": receipt.is_initialized,
+        "project": _pubkey(receipt.project),
+        "funder": _pubkey(receipt.funder),
+        "pending": receipt.pending,
+        "total_contributed": receipt.total_contributed,
+        "bump": receipt.bump,
+    }
+
+
+def encode_fund_project_deferred(amount: int) -> bytes:
+    """
+    Encode a `FundProjectDeferred` instruction
+
+    Args:
+        amount: Amount to fund in lamports
+
+    Returns:
+        Instruction data
+    """
+    return DapprInstruction.FundProjectDeferred(amount).encode()
+
+
+def encode_create_project_compact(title: str, funding_goal: int, metadata_hash: bytes) -> bytes:
+    """
+    Encode a `CreateProjectCompact` instruction
+
+    Args:
+        title: Project title
+        funding_goal: Funding goal in lamports
+        metadata_hash: Content hash of the off-chain metadata blob
+
+    Returns:
+        Instruction data
+    """
+    if len(metadata_hash) != 32:
+        raise ValueError("metadata_hash must be 32 bytes")
+    return DapprInstruction.CreateProjectCompact(title, funding_goal, metadata_hash).encode()
+
+
+def encode_add_milestone(title: str, description: str, deadline: int, reward: int) -> bytes:
+    """
+    Encode an `AddMilestone` instruction
+
+    Args:
+        title: Milestone title
+        description: Milestone description
+        deadline: Unix timestamp for milestone deadline
+        reward: Reward amount in lamports
+
+    Returns:
+        Instruction data
+    """
+    return DapprInstruction.AddMilestone(title, description, deadline, reward).encode()
+
+
+def encode_aggregate_funding() -> bytes:
+    """
+    Encode an `AggregateFunding` instruction
+
+    Returns:
+        Instruction data
+    """
+    return DapprInstruction.AggregateFunding().encode()
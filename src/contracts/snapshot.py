@@ -0,0 +1,266 @@
+"""
+Columnar snapshots of DAPPR project and funding data
+
+Streams decoded `ResearchProject` accounts into partitioned Arrow IPC files so
+analytics can be run offline, and the dashboard can load a local snapshot by
+memory-mapping it instead of scanning the chain.
+
+Layout of a snapshot directory:
+
+    <directory>/projects/part-00000.arrow
+    <directory>/participants/part-00000.arrow
+    <directory>/ip_ownership/part-00000.arrow
+    <directory>/milestones/part-00000.arrow
+
+A snapshot is written next to its target directory and swapped in when it is
+complete, so re-exporting replaces the previous snapshot instead of mixing
+partitions from both.
+"""
+import logging
+import os
+import shutil
+import struct
+import tempfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+from contracts.layout import decode_project
+from contracts.storage import MetadataStore
+
+logger = logging.getLogger(__name__)
+
+SCHEMAS = {
+    "projects": pa.schema([
+        ("project", pa.string()),
+        ("owner", pa.string()),
+        ("title", pa.string()),
+        ("description", pa.string()),
+        ("status", pa.dictionary(pa.int8(), pa.string())),
+        ("funding_goal", pa.uint64()),
+        ("funds_raised", pa.uint64()),
+        ("license_type", pa.string()),
+        ("commercial_rights", pa.bool_()),
+        ("metadata_hash", pa.binary(32)),
+    ]),
+    "participants": pa.schema([
+        ("project", pa.string()),
+        ("participant", pa.string()),
+    ]),
+    "ip_ownership": pa.schema([
+        ("project", pa.string()),
+        ("participant", pa.string()),
+        ("percentage", pa.uint8()),
+    ]),
+    "milestones": pa.schema([
+        ("project", pa.string()),
+        ("index", pa.uint8()),
+        ("title", pa.string()),
+        ("description", pa.string()),
+        ("deadline", pa.timestamp("s")),
+        ("reward", pa.uint64()),
+        ("completed", pa.bool_()),
+    ]),
+}
+
+
+class SnapshotWriter:
+    """Buffers decoded projects and writes them out in bounded-size partitions"""
+
+    def __init__(self, directory: Union[str, Path], chunk_size: int = 10_000):
+        """
+        Initialize the snapshot writer
+
+        Args:
+            directory: Directory the snapshot is written to, replaced on close
+            chunk_size: Number of projects buffered before a partition is written
+        """
+        self.directory = Path(directory)
+        self.chunk_size = chunk_size
+        self.project_count = 0
+        self._partition = 0
+        self._rows: Dict[str, Dict[str, list]] = {}
+        self._reset()
+        self.directory.parent.mkdir(parents=True, exist_ok=True)
+        # Partitions are staged in a sibling directory so the swap is a rename
+        self._staging = Path(tempfile.mkdtemp(prefix=f".{self.directory.name}.", dir=self.directory.parent))
+        for table in SCHEMAS:
+            (self._staging / table).mkdir()
+
+    def _reset(self) -> None:
+        self._rows = {
+            table: {name: [] for name in schema.names}
+            for table, schema in SCHEMAS.items()
+        }
+        self._buffered = 0
+
+    def add(self, pubkey: str, project: dict) -> None:
+        """
+        Add a decoded project to the snapshot
+
+        Args:
+            pubkey: Public key of the project account
+            project: Project as returned by `decode_project`
+        """
+        rows = self._rows["projects"]
+        rows["project"].append(pubkey)
+        rows["owner"].append(project["owner"])
+        rows["title"].append(project["title"])
+        rows["description"].append(project["description"])
+        rows["status"].append(project["status"])
+        rows["funding_goal"].append(project["funding_goal"])
+        rows["funds_raised"].append(project["funds_raised"])
+        rows["license_type"].append(project["ip_terms"]["license_type"])
+        rows["commercial_rights"].append(project["ip_terms"]["commercial_rights"])
+        rows["metadata_hash"].append(project["metadata_hash"])
+
+        rows = self._rows["participants"]
+        for participant in project["participants"]:
+            rows["project"].append(pubkey)
+            rows["participant"].append(participant)
+
+        rows = self._rows["ip_ownership"]
+        for participant, percentage in project["ip_terms"]["ownership_split"]:
+            rows["project"].append(pubkey)
+            rows["participant"].append(participant)
+            rows["percentage"].append(percentage)
+
+        rows = self._rows["milestones"]
+        for index, milestone in enumerate(project["milestones"]):
+            rows["project"].append(pubkey)
+            rows["index"].append(index)
+            rows["title"].append(milestone["title"])
+            rows["description"].append(milestone["description"])
+            rows["deadline"].append(milestone["deadline"])
+            rows["reward"].append(milestone["reward"])
+            rows["completed"].append(milestone["completed"])
+
+        self._buffered += 1
+        self.project_count += 1
+        if self._buffered >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered projects out as a new partition of every table"""
+        if not self._buffered:
+            return
+        name = f"part-{self._partition:05d}.arrow"
+        for table, schema in SCHEMAS.items():
+            batch = pa.record_batch(
+                [pa.array(self._rows[table][field.name], type=field.type) for field in schema],
+                schema=schema,
+            )
+            with pa.OSFile(str(self._staging / table / name), "wb") as sink:
+                with ipc.new_file(sink, schema) as writer:
+                    writer.write_batch(batch)
+        self._partition += 1
+        self._reset()
+
+    def close(self) -> None:
+        """Flush any remaining projects and replace the target directory with the snapshot"""
+        self.flush()
+        previous = None
+        if self.directory.exists():
+            previous = Path(tempfile.mkdtemp(prefix=f".{self.directory.name}.old.", dir=self.directory.parent))
+            os.replace(self.directory, previous / "snapshot")
+        os.replace(self._staging, self.directory)
+        if previous is not None:
+            shutil.rmtree(previous)
+
+    def abort(self) -> None:
+        """Discard the staged snapshot and leave the target directory untouched"""
+        shutil.rmtree(self._staging, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def export_snapshot(
+    accounts: Iterable[Tuple[str, bytes]],
+    directory: Union[str, Path],
+    chunk_size: int = 10_000,
+    metadata_store: Optional[MetadataStore] = None,
+) -> int:
+    """
+    Decode project accounts and write them to a columnar snapshot
+
+    Accounts that cannot be decoded are skipped and counted in a warning
+    rather than aborting the export. Compact projects whose metadata cannot be
+    resolved are exported with their on-chain fields only and also counted.
+
+    Args:
+        accounts: Iterable of (project pubkey, raw account data) pairs
+        directory: Directory the snapshot is written to
+        chunk_size: Number of projects per partition file
+        metadata_store: Store resolving the description and IP terms of compact projects
+
+    Returns:
+        Number of projects exported
+    """
+    skipped = 0
+    unresolved = 0
+    with SnapshotWriter(directory, chunk_size=chunk_size) as writer:
+        for pubkey, data in accounts:
+            try:
+                project = decode_project(data)
+            except (struct.error, IndexError, ValueError):
+                skipped += 1
+                continue
+            if not project["is_initialized"]:
+                continue
+            if project["metadata_hash"] is not None:
+                if metadata_store is None:
+                    unresolved += 1
+                else:
+                    try:
+                        project = metadata_store.resolve(project)
+                    except (KeyError, ValueError):
+                        unresolved += 1
+            writer.add(pubkey, project)
+    if skipped:
+        logger.warning("Skipped %d project accounts that could not be decoded", skipped)
+    if unresolved:
+        logger.warning("Exported %d compact projects without their off-chain metadata", unresolved)
+    return writer.project_count
+
+
+def load_table(directory: Union[str, Path], table: str) -> pa.Table:
+    """
+    Memory-map every partition of a snapshot table
+
+    The returned table references the mapped files directly, so loading does
+    not copy the column data into memory.
+
+    Args:
+        directory: Snapshot directory
+        table: Name of the table ("projects", "participants", ...)
+
+    Returns:
+        Arrow table with the rows of all partitions
+    """
+    batches: List[pa.RecordBatch] = []
+    for path in sorted((Path(directory) / table).glob("part-*.arrow")):
+        reader = ipc.open_file(pa.memory_map(str(path), "r"))
+        batches.extend(reader.get_batch(i) for i in range(reader.num_record_batches))
+    return pa.Table.from_batches(batches, schema=SCHEMAS[table])
+
+
+def load_snapshot(directory: Union[str, Path]) -> Dict[str, pa.Table]:
+    """
+    Memory-map all tables of a snapshot
+
+    Args:
+        directory: Snapshot directory
+
+    Returns:
+        Dictionary mapping table names to Arrow tables
+    """
+    return {table: load_table(directory, table) for table in SCHEMAS}
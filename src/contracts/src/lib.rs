@@ -7,6 +7,7 @@ use solana_program::{
     entrypoint,
     entrypoint::ProgramResult,
     msg,
+    program::{invoke, invoke_signed},
     program_error::ProgramError,
     pubkey::Pubkey,
     system_instruction,
@@ -21,6 +22,8 @@ solana_program::declare_id!("DAPPR1111111111111111111111111111111111111");
 const MAX_TITLE_LENGTH: usize = 100;
 const MAX_DESCRIPTION_LENGTH: usize = 1000;
 const MAX_PARTICIPANTS: usize = 10;
+const RECEIPT_SEED: &[u8] = b"receipt";
+const FUNDING_RECEIPT_LEN: usize = 1 + 32 + 32 + 8 + 8 + 1;
 
 // Program states
 #[derive(BorshSerialize, BorshDeserialize, Debug)]
@@ -35,6 +38,10 @@ pub struct ResearchProject {
     pub participants: Vec<Pubkey>,
     pub ip_terms: IPTerms,
     pub milestones: Vec<Milestone>,
+    /// SHA-256 of the off-chain metadata blob holding the description and full
+    /// `IPTerms`, set for projects created with `CreateProjectCompact`. Appended last
+    /// so zero-padded accounts written before it existed decode as `None`.
+    pub metadata_hash: Option<[u8; 32]>,
 }
 
 #[derive(BorshSerialize, BorshDeserialize, Debug, PartialEq, Clone)]
@@ -62,6 +69,22 @@ pub struct Milestone {
     pub completed: bool,
 }
 
+/// Per-funder record of contributions to a project.
+///
+/// Lives at the PDA `[RECEIPT_SEED, project, funder]`, so concurrent funders of the
+/// same project write disjoint accounts and never contend for a write lock on the
+/// project account itself. `pending` lamports are folded into the project by
+/// `AggregateFunding`.
+#[derive(BorshSerialize, BorshDeserialize, Debug)]
+pub struct FundingReceipt {
+    pub is_initialized: bool,
+    pub project: Pubkey,
+    pub funder: Pubkey,
+    pub pending: u64,
+    pub total_contributed: u64,
+    pub bump: u8,
+}
+
 // Program entrypoint
 entrypoint!(process_instruction);
 
@@ -79,7 +102,7 @@ pub fn process_instruction(
     match instruction {
         DapprInstruction::CreateProject { title, description, funding_goal, ip_terms } => {
             msg!("Instruction: CreateProject");
-            create_project(program_id, accounts, title, description, funding_goal, ip_terms)
+            create_project(program_id, accounts, title, description, funding_goal, ip_terms, None)
         },
         DapprInstruction::FundProject { amount } => {
             msg!("Instruction: FundProject");
@@ -97,6 +120,23 @@ pub fn process_instruction(
             msg!("Instruction: DisputeResolution");
             resolve_dispute(program_id, accounts, resolution)
         },
+        DapprInstruction::FundProjectDeferred { amount } => {
+            msg!("Instruction: FundProjectDeferred");
+            fund_project_deferred(program_id, accounts, amount)
+        },
+        DapprInstruction::AggregateFunding => {
+            msg!("Instruction: AggregateFunding");
+            aggregate_funding(program_id, accounts)
+        },
+        DapprInstruction::CreateProjectCompact { title, funding_goal, metadata_hash } => {
+            msg!("Instruction: CreateProjectCompact");
+            let ip_terms = IPTerms {
+                ownership_split: Vec::new(),
+                license_type: String::new(),
+                commercial_rights: false,
+            };
+            create_project(program_id, accounts, title, String::new(), funding_goal, ip_terms, Some(metadata_hash))
+        },
     }
 }
 
@@ -109,9 +149,15 @@ pub enum DapprInstruction {
         funding_goal: u64,
         ip_terms: IPTerms,
     },
+    /// Contribute to a project directly, write-locking the project account.
+    ///
+    /// Accounts: [signer, writable] funder, [writable] project, [] system program
     FundProject {
         amount: u64,
     },
+    /// Append a milestone to a project, growing the account if it no longer fits.
+    ///
+    /// Accounts: [writable] project, [signer, writable] owner, [] system program
     AddMilestone {
         title: String,
         description: String,
@@ -124,6 +170,26 @@ pub enum DapprInstruction {
     DisputeResolution {
         resolution: String,
     },
+    /// Contribute to a project through the funder's receipt account, leaving the
+    /// project account read-only.
+    ///
+    /// Accounts: [signer, writable] funder, [] project, [writable] receipt PDA, [] system program
+    FundProjectDeferred {
+        amount: u64,
+    },
+    /// Move pending receipt contributions into the project and update `funds_raised`.
+    ///
+    /// Accounts: [writable] project, [writable] receipt PDAs...
+    AggregateFunding,
+    /// Create a project whose description and IP terms live in a content-addressed
+    /// off-chain blob, keeping only its 32-byte hash in the account.
+    ///
+    /// Accounts: [writable] project, [signer] owner, [] system program
+    CreateProjectCompact {
+        title: String,
+        funding_goal: u64,
+        metadata_hash: [u8; 32],
+    },
 }
 
 // Implementation of core functions
@@ -134,6 +200,7 @@ fn create_project(
     description: String,
     funding_goal: u64,
     ip_terms: IPTerms,
+    metadata_hash: Option<[u8; 32]>,
 ) -> ProgramResult {
     // Validate input
     if title.len() > MAX_TITLE_LENGTH || description.len() > MAX_DESCRIPTION_LENGTH {
@@ -146,8 +213,15 @@ fn create_project(
     let owner = next_account_info(account_info_iter)?;
     let system_program = next_account_info(account_info_iter)?;
     
-    // Check if project account is already initialized
-    if project_account.data_is_empty() {
+    // The owner is recorded as the project's owner, so it must sign
+    if !owner.is_signer {
+        return Err(ProgramError::MissingRequiredSignature);
+    }
+    
+    // Check if project account is already initialized. Accounts are allocated by the
+    // client before this instruction runs, so look at the `is_initialized` flag
+    // rather than whether the account has data.
+    if project_account.data.borrow().first() != Some(&1) {
         // Initialize project
         let project = ResearchProject {
             is_initialized: true,
@@ -160,6 +234,7 @@ fn create_project(
             participants: vec![*owner.key],
             ip_terms,
             milestones: Vec::new(),
+            metadata_hash,
         };
         
         // Serialize and save
@@ -171,30 +246,268 @@ fn create_project(
     }
 }
 
-// Stub implementations for other functions
 fn fund_project(
-    _program_id: &Pubkey,
-    _accounts: &[AccountInfo],
-    _amount: u64,
+    program_id: &Pubkey,
+    accounts: &[AccountInfo],
+    amount: u64,
 ) -> ProgramResult {
-    // Implementation would include:
-    // 1. Transfer funds to project account
-    // 2. Update funds_raised
-    // 3. Handle token transfers if using SPL tokens
+    // Get accounts
+    let account_info_iter = &mut accounts.iter();
+    let funder = next_account_info(account_info_iter)?;
+    let project_account = next_account_info(account_info_iter)?;
+    let system_program = next_account_info(account_info_iter)?;
+
+    if !funder.is_signer {
+        return Err(ProgramError::MissingRequiredSignature);
+    }
+    if project_account.owner != program_id {
+        return Err(ProgramError::IncorrectProgramId);
+    }
+
+    let mut project = ResearchProject::deserialize(&mut &project_account.data.borrow()[..])?;
+    if !project.is_initialized {
+        return Err(ProgramError::UninitializedAccount);
+    }
+
+    // Every direct contribution write-locks the project account
+    invoke(
+        &system_instruction::transfer(funder.key, project_account.key, amount),
+        &[funder.clone(), project_account.clone(), system_program.clone()],
+    )?;
+
+    project.funds_raised = project
+        .funds_raised
+        .checked_add(amount)
+        .ok_or(ProgramError::ArithmeticOverflow)?;
+    project.serialize(&mut &mut project_account.data.borrow_mut()[..])?;
+    Ok(())
+}
+
+fn fund_project_deferred(
+    program_id: &Pubkey,
+    accounts: &[AccountInfo],
+    amount: u64,
+) -> ProgramResult {
+    // Get accounts
+    let account_info_iter = &mut accounts.iter();
+    let funder = next_account_info(account_info_iter)?;
+    let project_account = next_account_info(account_info_iter)?;
+    let receipt_account = next_account_info(account_info_iter)?;
+    let system_program = next_account_info(account_info_iter)?;
+
+    if !funder.is_signer {
+        return Err(ProgramError::MissingRequiredSignature);
+    }
+    if project_account.owner != program_id {
+        return Err(ProgramError::IncorrectProgramId);
+    }
+
+    // The project is only read, so funders never take a write lock on it
+    let project = ResearchProject::deserialize(&mut &project_account.data.borrow()[..])?;
+    if !project.is_initialized {
+        return Err(ProgramError::UninitializedAccount);
+    }
+
+    let (receipt_key, bump) = Pubkey::find_program_address(
+        &[RECEIPT_SEED, project_account.key.as_ref(), funder.key.as_ref()],
+        program_id,
+    );
+    if receipt_key != *receipt_account.key {
+        return Err(ProgramError::InvalidSeeds);
+    }
+
+    let mut receipt = if receipt_account.data_is_empty() {
+        // First contribution from this funder, create the receipt account
+        let rent = Rent::get()?;
+        let required_lamports = rent.minimum_balance(FUNDING_RECEIPT_LEN);
+        let bump_seed = [bump];
+        let signer_seeds: &[&[u8]] = &[RECEIPT_SEED, project_account.key.as_ref(), funder.key.as_ref(), &bump_seed];
+        if receipt_account.lamports() == 0 {
+            invoke_signed(
+                &system_instruction::create_account(
+                    funder.key,
+                    receipt_account.key,
+                    required_lamports,
+                    FUNDING_RECEIPT_LEN as u64,
+                    program_id,
+                ),
+                &[funder.clone(), receipt_account.clone(), system_program.clone()],
+                &[signer_seeds],
+            )?;
+        } else {
+            // Anyone can send lamports to the address, which makes `create_account`
+            // fail. Top the account up to rent exemption and allocate it in place
+            // instead, so pre-funding the PDA cannot lock the funder out.
+            let top_up = required_lamports.saturating_sub(receipt_account.lamports());
+            if top_up > 0 {
+                invoke(
+                    &system_instruction::transfer(funder.key, receipt_account.key, top_up),
+                    &[funder.clone(), receipt_account.clone(), system_program.clone()],
+                )?;
+            }
+            invoke_signed(
+                &system_instruction::allocate(receipt_account.key, FUNDING_RECEIPT_LEN as u64),
+                &[receipt_account.clone(), system_program.clone()],
+                &[signer_seeds],
+            )?;
+            invoke_signed(
+                &system_instruction::assign(receipt_account.key, program_id),
+                &[receipt_account.clone(), system_program.clone()],
+                &[signer_seeds],
+            )?;
+        }
+        FundingReceipt {
+            is_initialized: true,
+            project: *project_account.key,
+            funder: *funder.key,
+            pending: 0,
+            total_contributed: 0,
+            bump,
+        }
+    } else {
+        if receipt_account.owner != program_id {
+            return Err(ProgramError::IncorrectProgramId);
+        }
+        FundingReceipt::try_from_slice(&receipt_account.data.borrow())?
+    };
+
+    // Hold the contribution in the receipt until it is aggregated
+    invoke(
+        &system_instruction::transfer(funder.key, receipt_account.key, amount),
+        &[funder.clone(), receipt_account.clone(), system_program.clone()],
+    )?;
+
+    receipt.pending = receipt.pending.checked_add(amount).ok_or(ProgramError::ArithmeticOverflow)?;
+    receipt.total_contributed = receipt
+        .total_contributed
+        .checked_add(amount)
+        .ok_or(ProgramError::ArithmeticOverflow)?;
+    receipt.serialize(&mut &mut receipt_account.data.borrow_mut()[..])?;
+    Ok(())
+}
+
+fn aggregate_funding(
+    program_id: &Pubkey,
+    accounts: &[AccountInfo],
+) -> ProgramResult {
+    // Get accounts, every remaining account is a receipt to fold in
+    let account_info_iter = &mut accounts.iter();
+    let project_account = next_account_info(account_info_iter)?;
+
+    if project_account.owner != program_id {
+        return Err(ProgramError::IncorrectProgramId);
+    }
+    let mut project = ResearchProject::deserialize(&mut &project_account.data.borrow()[..])?;
+    if !project.is_initialized {
+        return Err(ProgramError::UninitializedAccount);
+    }
+
+    for receipt_account in account_info_iter {
+        if receipt_account.owner != program_id {
+            return Err(ProgramError::IncorrectProgramId);
+        }
+        let mut receipt = FundingReceipt::try_from_slice(&receipt_account.data.borrow())?;
+        if receipt.project != *project_account.key {
+            return Err(ProgramError::InvalidArgument);
+        }
+        if receipt.pending == 0 {
+            continue;
+        }
+
+        // Both accounts are owned by this program, so lamports can be moved directly
+        **receipt_account.try_borrow_mut_lamports()? = receipt_account
+            .lamports()
+            .checked_sub(receipt.pending)
+            .ok_or(ProgramError::InsufficientFunds)?;
+        **project_account.try_borrow_mut_lamports()? = project_account
+            .lamports()
+            .checked_add(receipt.pending)
+            .ok_or(ProgramError::ArithmeticOverflow)?;
+
+        project.funds_raised = project
+            .funds_raised
+            .checked_add(receipt.pending)
+            .ok_or(ProgramError::ArithmeticOverflow)?;
+        receipt.pending = 0;
+        receipt.serialize(&mut &mut receipt_account.data.borrow_mut()[..])?;
+    }
+
+    project.serialize(&mut &mut project_account.data.borrow_mut()[..])?;
     Ok(())
 }
 
 fn add_milestone(
-    _program_id: &Pubkey,
-    _accounts: &[AccountInfo],
-    _title: String,
-    _description: String,
-    _deadline: i64,
-    _reward: u64,
+    program_id: &Pubkey,
+    accounts: &[AccountInfo],
+    title: String,
+    description: String,
+    deadline: i64,
+    reward: u64,
 ) -> ProgramResult {
-    // Implementation would include:
-    // 1. Add milestone to project
-    // 2. Validate permissions
+    // Validate input
+    if title.len() > MAX_TITLE_LENGTH || description.len() > MAX_DESCRIPTION_LENGTH {
+        return Err(ProgramError::InvalidArgument);
+    }
+
+    // Get accounts
+    let account_info_iter = &mut accounts.iter();
+    let project_account = next_account_info(account_info_iter)?;
+    let owner = next_account_info(account_info_iter)?;
+    let system_program = next_account_info(account_info_iter)?;
+
+    if !owner.is_signer {
+        return Err(ProgramError::MissingRequiredSignature);
+    }
+    if project_account.owner != program_id {
+        return Err(ProgramError::IncorrectProgramId);
+    }
+
+    let mut project = ResearchProject::deserialize(&mut &project_account.data.borrow()[..])?;
+    if !project.is_initialized {
+        return Err(ProgramError::UninitializedAccount);
+    }
+    if project.owner != *owner.key {
+        return Err(ProgramError::IllegalOwner);
+    }
+
+    project.milestones.push(Milestone {
+        title,
+        description,
+        deadline,
+        reward,
+        completed: false,
+    });
+    save_project(&project, project_account, owner, system_program)
+}
+
+/// Serialize a project into its account, growing the account if the project
+/// no longer fits.
+///
+/// Accounts are allocated by the client for the project as created, so
+/// anything appended later, e.g. milestones, may need more space. The payer
+/// covers the additional rent, the project's raised funds are never used for it.
+fn save_project<'a>(
+    project: &ResearchProject,
+    project_account: &AccountInfo<'a>,
+    payer: &AccountInfo<'a>,
+    system_program: &AccountInfo<'a>,
+) -> ProgramResult {
+    let data = project.try_to_vec()?;
+    let current_len = project_account.data_len();
+    if data.len() > current_len {
+        let rent = Rent::get()?;
+        let top_up = rent
+            .minimum_balance(data.len())
+            .saturating_sub(rent.minimum_balance(current_len));
+        if top_up > 0 {
+            invoke(
+                &system_instruction::transfer(payer.key, project_account.key, top_up),
+                &[payer.clone(), project_account.clone(), system_program.clone()],
+            )?;
+        }
+        project_account.realloc(data.len(), false)?;
+    }
+    project_account.data.borrow_mut()[..data.len()].copy_from_slice(&data);
     Ok(())
 }
 
@@ -240,4 +553,209 @@ mod tests {
     fn test_create_project() {
         // Test setup and assertions would go here
     }
+
+    /// Funding contention checks.
+    ///
+    /// These stand in for a parallelism benchmark and demonstrate no measured
+    /// gain. `BanksClient` executes transactions one at a time, so only the input
+    /// to the runtime scheduler is checked: the accounts each hand-built funding
+    /// transaction write-locks. Measuring throughput needs a multi-threaded
+    /// validator, e.g. `solana-test-validator` under `solana-bench-tps`-style load.
+    mod funding_contention {
+        use super::*;
+        use solana_program::instruction::{AccountMeta, Instruction};
+        use solana_program_test::{processor, tokio, BanksClient, ProgramTest};
+        use solana_sdk::{account::Account, hash::Hash, system_program};
+        use std::collections::HashMap;
+
+        const FUNDERS: usize = 64;
+        const CONTRIBUTION: u64 = 1_000_000;
+        const RECEIPTS_PER_AGGREGATION: usize = 20;
+
+        fn project_account(owner: Pubkey) -> Account {
+            let project = ResearchProject {
+                is_initialized: true,
+                owner,
+                title: "Benchmark".to_string(),
+                description: String::new(),
+                status: ProjectStatus::Active,
+                funding_goal: u64::MAX,
+                funds_raised: 0,
+                participants: vec![owner],
+                ip_terms: IPTerms {
+                    ownership_split: vec![(owner, 100)],
+                    license_type: "MIT".to_string(),
+                    commercial_rights: false,
+                },
+                milestones: Vec::new(),
+                metadata_hash: None,
+            };
+            let mut data = project.try_to_vec().unwrap();
+            data.resize(1024, 0);
+            Account {
+                lamports: Rent::default().minimum_balance(data.len()),
+                data,
+                owner: id(),
+                executable: false,
+                rent_epoch: 0,
+            }
+        }
+
+        fn receipt_address(project: &Pubkey, funder: &Pubkey) -> Pubkey {
+            Pubkey::find_program_address(&[RECEIPT_SEED, project.as_ref(), funder.as_ref()], &id()).0
+        }
+
+        /// Highest number of transactions in the batch that write-lock the same account.
+        fn max_writers(transactions: &[Transaction]) -> usize {
+            let mut writers: HashMap<Pubkey, usize> = HashMap::new();
+            for transaction in transactions {
+                let message = &transaction.message;
+                for (index, key) in message.account_keys.iter().enumerate() {
+                    if message.is_writable(index) {
+                        *writers.entry(*key).or_default() += 1;
+                    }
+                }
+            }
+            writers.into_values().max().unwrap_or(0)
+        }
+
+        async fn process_all(banks_client: &mut BanksClient, transactions: Vec<Transaction>) {
+            for transaction in transactions {
+                banks_client.process_transaction(transaction).await.unwrap();
+            }
+        }
+
+        async fn funds_raised(banks_client: &mut BanksClient, project: Pubkey) -> u64 {
+            let account = banks_client.get_account(project).await.unwrap().unwrap();
+            ResearchProject::deserialize(&mut &account.data[..]).unwrap().funds_raised
+        }
+
+        fn deferred_instruction(project: Pubkey, funder: Pubkey) -> Instruction {
+            Instruction::new_with_borsh(
+                id(),
+                &DapprInstruction::FundProjectDeferred { amount: CONTRIBUTION },
+                vec![
+                    AccountMeta::new(funder, true),
+                    AccountMeta::new_readonly(project, false),
+                    AccountMeta::new(receipt_address(&project, &funder), false),
+                    AccountMeta::new_readonly(system_program::id(), false),
+                ],
+            )
+        }
+
+        fn funding_transactions(
+            project: Pubkey,
+            funders: &[Keypair],
+            blockhash: Hash,
+            deferred: bool,
+        ) -> Vec<Transaction> {
+            funders
+                .iter()
+                .map(|funder| {
+                    let instruction = if deferred {
+                        deferred_instruction(project, funder.pubkey())
+                    } else {
+                        Instruction::new_with_borsh(
+                            id(),
+                            &DapprInstruction::FundProject { amount: CONTRIBUTION },
+                            vec![
+                                AccountMeta::new(funder.pubkey(), true),
+                                AccountMeta::new(project, false),
+                                AccountMeta::new_readonly(system_program::id(), false),
+                            ],
+                        )
+                    };
+                    Transaction::new_signed_with_payer(&[instruction], Some(&funder.pubkey()), &[funder], blockhash)
+                })
+                .collect()
+        }
+
+        #[tokio::test]
+        async fn concurrent_funders_write_disjoint_accounts() {
+            let direct_project = Pubkey::new_unique();
+            let deferred_project = Pubkey::new_unique();
+            let direct_funders: Vec<Keypair> = (0..FUNDERS).map(|_| Keypair::new()).collect();
+            let deferred_funders: Vec<Keypair> = (0..FUNDERS).map(|_| Keypair::new()).collect();
+
+            let mut program_test = ProgramTest::new("dappr_contracts", id(), processor!(process_instruction));
+            program_test.add_account(direct_project, project_account(Pubkey::new_unique()));
+            program_test.add_account(deferred_project, project_account(Pubkey::new_unique()));
+            for funder in direct_funders.iter().chain(&deferred_funders) {
+                program_test.add_account(
+                    funder.pubkey(),
+                    Account::new(1_000_000_000, 0, &system_program::id()),
+                );
+            }
+            let (mut banks_client, payer, blockhash) = program_test.start().await;
+
+            // Every direct funding transaction write-locks the project, so the scheduler
+            // must run them one at a time. Deferred funding only write-locks per-funder
+            // accounts, so no two of these transactions conflict.
+            let direct = funding_transactions(direct_project, &direct_funders, blockhash, false);
+            let deferred = funding_transactions(deferred_project, &deferred_funders, blockhash, true);
+            assert_eq!(max_writers(&direct), FUNDERS);
+            assert_eq!(max_writers(&deferred), 1);
+
+            process_all(&mut banks_client, direct).await;
+            process_all(&mut banks_client, deferred).await;
+            assert_eq!(funds_raised(&mut banks_client, direct_project).await, CONTRIBUTION * FUNDERS as u64);
+            assert_eq!(funds_raised(&mut banks_client, deferred_project).await, 0);
+
+            // Fold the receipts into the project
+            let receipts: Vec<Pubkey> = deferred_funders
+                .iter()
+                .map(|funder| receipt_address(&deferred_project, &funder.pubkey()))
+                .collect();
+            for chunk in receipts.chunks(RECEIPTS_PER_AGGREGATION) {
+                let mut accounts = vec![AccountMeta::new(deferred_project, false)];
+                accounts.extend(chunk.iter().map(|receipt| AccountMeta::new(*receipt, false)));
+                let instruction = Instruction::new_with_borsh(id(), &DapprInstruction::AggregateFunding, accounts);
+                let transaction = Transaction::new_signed_with_payer(&[instruction], Some(&payer.pubkey()), &[&payer], blockhash);
+                banks_client.process_transaction(transaction).await.unwrap();
+            }
+
+            assert_eq!(funds_raised(&mut banks_client, deferred_project).await, CONTRIBUTION * FUNDERS as u64);
+            for receipt in receipts {
+                let account = banks_client.get_account(receipt).await.unwrap().unwrap();
+                let receipt = FundingReceipt::try_from_slice(&account.data).unwrap();
+                assert_eq!(receipt.pending, 0);
+                assert_eq!(receipt.total_contributed, CONTRIBUTION);
+            }
+        }
+
+        #[tokio::test]
+        async fn prefunded_receipt_does_not_block_funder() {
+            let project = Pubkey::new_unique();
+            let funder = Keypair::new();
+
+            let mut program_test = ProgramTest::new("dappr_contracts", id(), processor!(process_instruction));
+            program_test.add_account(project, project_account(Pubkey::new_unique()));
+            program_test.add_account(funder.pubkey(), Account::new(1_000_000_000, 0, &system_program::id()));
+            let (mut banks_client, payer, blockhash) = program_test.start().await;
+
+            // Someone else sends lamports to the funder's receipt address first
+            let receipt = receipt_address(&project, &funder.pubkey());
+            let griefing = Transaction::new_signed_with_payer(
+                &[system_instruction::transfer(&payer.pubkey(), &receipt, Rent::default().minimum_balance(0))],
+                Some(&payer.pubkey()),
+                &[&payer],
+                blockhash,
+            );
+            banks_client.process_transaction(griefing).await.unwrap();
+
+            let transaction = Transaction::new_signed_with_payer(
+                &[deferred_instruction(project, funder.pubkey())],
+                Some(&funder.pubkey()),
+                &[&funder],
+                blockhash,
+            );
+            banks_client.process_transaction(transaction).await.unwrap();
+
+            let account = banks_client.get_account(receipt).await.unwrap().unwrap();
+            assert_eq!(account.owner, id());
+            let receipt = FundingReceipt::try_from_slice(&account.data).unwrap();
+            assert_eq!(receipt.pending, CONTRIBUTION);
+            assert_eq!(receipt.total_contributed, CONTRIBUTION);
+        }
+    }
 }
@@ -0,0 +1,257 @@
+"""
+Content-addressed off-chain storage for DAPPR project metadata
+
+Long project descriptions and full IP terms are kept out of the project account.
+They are serialized into a blob addressed by its SHA-256 hash, and only the
+32-byte hash is stored on chain. Blobs are fetched lazily, verified against the
+hash and cached locally.
+"""
+import copy
+import hashlib
+import json
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+# Fields of the on-chain `IPTerms`, all of which are stored off chain for compact projects
+IP_TERMS_FIELDS = ("ownership_split", "license_type", "commercial_rights")
+
+
+def content_hash(blob: bytes) -> bytes:
+    """
+    Compute the content address of a blob
+
+    Args:
+        blob: Blob contents
+
+    Returns:
+        32-byte SHA-256 digest
+    """
+    return hashlib.sha256(blob).digest()
+
+
+def encode_metadata(description: str, ip_terms: dict) -> bytes:
+    """
+    Serialize project metadata into a canonical blob
+
+    Keys are sorted and whitespace is stripped so the same metadata always
+    produces the same hash.
+
+    Args:
+        description: Project description
+        ip_terms: Dictionary containing IP terms
+
+    Returns:
+        Metadata blob
+    """
+    metadata = {"description": description, "ip_terms": ip_terms}
+    return json.dumps(metadata, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def validate_ip_terms(ip_terms: dict) -> None:
+    """
+    Check that IP terms have the shape of the on-chain `IPTerms`
+
+    Args:
+        ip_terms: Dictionary containing IP terms
+
+    Raises:
+        ValueError: If a field is missing, unknown or of the wrong type
+    """
+    if not isinstance(ip_terms, dict):
+        raise ValueError("ip_terms must be a dictionary")
+    if set(ip_terms) != set(IP_TERMS_FIELDS):
+        raise ValueError(f"ip_terms must have exactly the fields {', '.join(IP_TERMS_FIELDS)}")
+    if not isinstance(ip_terms["ownership_split"], (list, tuple)):
+        raise ValueError("ownership_split must be a list of (participant, percentage) pairs")
+    for entry in ip_terms["ownership_split"]:
+        if not isinstance(entry, (list, tuple)) or len(entry) != 2:
+            raise ValueError(f"ownership_split entries must be (participant, percentage) pairs, got {entry!r}")
+        participant, percentage = entry
+        if not isinstance(participant, str):
+            raise ValueError(f"ownership_split participant must be a public key string, got {participant!r}")
+        # bool is an int subclass, but not a percentage
+        if isinstance(percentage, bool) or not isinstance(percentage, int) or not 0 <= percentage <= 100:
+            raise ValueError(f"ownership_split percentage must be an integer from 0 to 100, got {percentage!r}")
+    if not isinstance(ip_terms["license_type"], str):
+        raise ValueError("license_type must be a string")
+    if not isinstance(ip_terms["commercial_rights"], bool):
+        raise ValueError("commercial_rights must be a boolean")
+
+
+def decode_metadata(blob: bytes) -> dict:
+    """
+    Deserialize and validate a metadata blob
+
+    Args:
+        blob: Metadata blob
+
+    Returns:
+        Dictionary with the project description and IP terms
+
+    Raises:
+        ValueError: If the blob is not valid metadata
+    """
+    metadata = json.loads(blob.decode("utf-8"))
+    if not isinstance(metadata, dict) or set(metadata) != {"description", "ip_terms"}:
+        raise ValueError("Metadata must have exactly the fields description, ip_terms")
+    if not isinstance(metadata["description"], str):
+        raise ValueError("description must be a string")
+    validate_ip_terms(metadata["ip_terms"])
+    return metadata
+
+
+class BlobStore(ABC):
+    """Backend interface for content-addressed blob storage"""
+
+    @abstractmethod
+    def put(self, blob: bytes) -> bytes:
+        """
+        Store a blob
+
+        Args:
+            blob: Blob contents
+
+        Returns:
+            Content hash of the blob
+        """
+
+    @abstractmethod
+    def get(self, digest: bytes) -> Optional[bytes]:
+        """
+        Fetch a blob by content hash
+
+        Args:
+            digest: Content hash of the blob
+
+        Returns:
+            Blob contents, or None if the blob is not stored
+        """
+
+
+class LocalBlobStore(BlobStore):
+    """Blob store backed by a local directory"""
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Initialize the local blob store
+
+        Args:
+            directory: Directory blobs are stored in
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, digest: bytes) -> Path:
+        name = digest.hex()
+        # Fan out over subdirectories to keep directory listings short
+        return self.directory / name[:2] / name[2:]
+
+    def put(self, blob: bytes) -> bytes:
+        digest = content_hash(blob)
+        path = self._path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            # Write through a temporary file so readers never see a partial blob
+            fd, tmp = tempfile.mkstemp(dir=path.parent)
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp, path)
+        return digest
+
+    def get(self, digest: bytes) -> Optional[bytes]:
+        try:
+            return self._path(digest).read_bytes()
+        except FileNotFoundError:
+            return None
+
+
+class MetadataStore:
+    """Verifying, caching front end for project metadata in a blob store"""
+
+    def __init__(self, backend: BlobStore, cache_size: int = 1024):
+        """
+        Initialize the metadata store
+
+        Args:
+            backend: Blob store holding the metadata blobs
+            cache_size: Number of decoded metadata entries kept in memory
+        """
+        self.backend = backend
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[bytes, dict]" = OrderedDict()
+
+    def put(self, description: str, ip_terms: dict) -> bytes:
+        """
+        Store project metadata
+
+        Args:
+            description: Project description
+            ip_terms: Dictionary containing IP terms
+
+        Returns:
+            32-byte content hash to record on chain
+
+        Raises:
+            ValueError: If the description or IP terms are malformed
+        """
+        if not isinstance(description, str):
+            raise ValueError("description must be a string")
+        validate_ip_terms(ip_terms)
+        return self.backend.put(encode_metadata(description, ip_terms))
+
+    def get(self, digest: bytes) -> dict:
+        """
+        Fetch and verify project metadata
+
+        Args:
+            digest: Content hash recorded on chain
+
+        Returns:
+            Dictionary with the project description and IP terms, a copy the
+            caller is free to modify
+
+        Raises:
+            KeyError: If the blob is not stored
+            ValueError: If the blob does not match its hash or is malformed
+        """
+        metadata = self._cache.get(digest)
+        if metadata is not None:
+            self._cache.move_to_end(digest)
+            return copy.deepcopy(metadata)
+
+        blob = self.backend.get(digest)
+        if blob is None:
+            raise KeyError(f"Metadata blob not found: {digest.hex()}")
+        if content_hash(blob) != digest:
+            raise ValueError(f"Metadata blob does not match its hash: {digest.hex()}")
+
+        metadata = decode_metadata(blob)
+        self._cache[digest] = metadata
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return copy.deepcopy(metadata)
+
+    def resolve(self, project: dict) -> dict:
+        """
+        Fill in the off-chain description and IP terms of a compact project
+
+        Args:
+            project: Project as returned by `decode_project`, with a metadata hash
+
+        Returns:
+            Copy of the project with the metadata applied, in the same shape as
+            a project decoded entirely from chain
+
+        Raises:
+            KeyError: If the blob is not stored
+            ValueError: If the blob does not match its hash or is malformed
+        """
+        metadata = self.get(project["metadata_hash"])
+        ip_terms = metadata["ip_terms"]
+        # JSON has no tuples, restore the (participant, percentage) pairs
+        ip_terms["ownership_split"] = [tuple(entry) for entry in ip_terms["ownership_split"]]
+        return {**project, "description": metadata["description"], "ip_terms": ip_terms}
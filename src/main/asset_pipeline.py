@@ -0,0 +1,346 @@
+"""
+Static asset pipeline for the DAPPR app
+
+Minifies CSS and SVG, typesets the Markdown whitepaper as a PDF and
+content-hashes filenames into `src/main/static`.
+
+Streamlit's static file handler only sends images, fonts and PDFs with their
+real content type. Anything else goes out as `text/plain` with `nosniff`, which
+browsers refuse as a stylesheet or image. So the app inlines the minified
+stylesheet, read once per server process, and renders SVGs with `st.image`.
+Only files the handler serves correctly, like the whitepaper PDF, get a URL
+from `asset_url`. Their hashed names never change content, and the `?v=`
+version makes the handler send far-future cache headers.
+
+Run directly to rebuild the assets:
+
+    python src/main/asset_pipeline.py
+"""
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, List
+
+ROOT_DIR = Path(__file__).resolve().parent.parent.parent
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+MANIFEST_PATH = STATIC_DIR / "manifest.json"
+
+# Assets used by the app, relative to the repository root
+SOURCES = [
+    "assets/styles.css",
+    "assets/logo.svg",
+    "assets/Whitepaper",
+]
+
+# Extensions Streamlit's static file handler serves with their real content type
+STATIC_SERVED_SUFFIXES = {
+    ".jpg", ".jpeg", ".png", ".gif", ".webp",
+    ".otf", ".ttf", ".woff", ".woff2",
+    ".pdf",
+}
+
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCTUATION_RE = re.compile(r"\s*([{};>,])\s*")
+_CSS_COLON_RE = re.compile(r":\s+")
+_XML_COMMENT_RE = re.compile(r"<!--.*?-->", re.S)
+_XML_BETWEEN_TAGS_RE = re.compile(r">\s+<")
+_SVG_STYLE_RE = re.compile(r"(<style[^>]*>)(.*?)(</style>)", re.S)
+
+
+def minify_css(css: str) -> str:
+    """
+    Strip comments and redundant whitespace from a stylesheet
+
+    Args:
+        css: Stylesheet source
+
+    Returns:
+        Minified stylesheet
+    """
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCTUATION_RE.sub(r"\1", css)
+    # Only whitespace after a colon is dropped, before one it can be a descendant selector
+    css = _CSS_COLON_RE.sub(":", css)
+    return css.replace(";}", "}").strip()
+
+
+def minify_svg(svg: str) -> str:
+    """
+    Strip comments and whitespace between tags from an SVG image
+
+    Args:
+        svg: SVG source
+
+    Returns:
+        Minified SVG
+    """
+    svg = _XML_COMMENT_RE.sub("", svg)
+    svg = _SVG_STYLE_RE.sub(lambda m: m.group(1) + minify_css(m.group(2)) + m.group(3), svg)
+    svg = _XML_BETWEEN_TAGS_RE.sub("><", svg)
+    return svg.strip()
+
+
+# A4 in points, with 2 cm margins
+_PAGE_WIDTH = 595
+_PAGE_HEIGHT = 842
+_MARGIN = 56
+
+# Glyph widths of Helvetica in 1/1000 em for ASCII 32-126, from its AFM metrics
+_HELVETICA_WIDTHS = dict(zip(map(chr, range(32, 127)), [
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+]))
+_HELVETICA_WIDTHS.update({"’": 222, "—": 1000, "•": 350})
+
+# Font size, space above and font of each heading level
+_PDF_HEADINGS = {
+    1: (18, 0, "F2"),
+    2: (14, 14, "F2"),
+    3: (12, 10, "F2"),
+}
+_PDF_BODY_SIZE = 10
+_PDF_INDENT = 14
+
+_MD_HEADING_RE = re.compile(r"(#{1,3}) +(.*)")
+_MD_LIST_ITEM_RE = re.compile(r"( *)([-*]|\d+\.) +(.*)")
+_MD_EMPHASIS_RE = re.compile(r"\*\*(.+?)\*\*")
+_MD_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+
+
+def _text_width(text: str, size: float) -> float:
+    return sum(_HELVETICA_WIDTHS.get(c, 556) for c in text) * size / 1000
+
+
+def _wrap(text: str, width: float, size: float) -> List[str]:
+    lines = []
+    line = ""
+    for word in text.split():
+        candidate = f"{line} {word}" if line else word
+        if line and _text_width(candidate, size) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    if line:
+        lines.append(line)
+    return lines
+
+
+def _pdf_string(text: str) -> str:
+    # Standard fonts use WinAnsiEncoding, which is cp1252 for the printable range
+    raw = text.encode("cp1252", errors="replace").decode("latin-1")
+    return "(" + raw.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def markdown_to_pdf(markdown: str) -> bytes:
+    """
+    Typeset a Markdown document as a PDF
+
+    Handles the subset the whitepaper uses: headings, paragraphs and nested
+    lists. Emphasis and link targets are dropped. The output contains no
+    timestamps, so the same source always builds the same file.
+
+    Args:
+        markdown: Markdown source
+
+    Returns:
+        PDF document
+    """
+    line_width = _PAGE_WIDTH - 2 * _MARGIN
+    pages: List[List[str]] = [[]]
+    y = _PAGE_HEIGHT - _MARGIN
+
+    def emit(lines: List[str], x: float, size: float, font: str, space_before: float,
+             marker: str = "") -> None:
+        nonlocal y
+        leading = size * 1.4
+        y -= space_before
+        for i, line in enumerate(lines):
+            if y - leading < _MARGIN:
+                pages.append([])
+                y = _PAGE_HEIGHT - _MARGIN
+            y -= leading
+            if i == 0 and marker:
+                pages[-1].append(f"BT /F1 {size} Tf {x - _PDF_INDENT:.2f} {y:.2f} Td {_pdf_string(marker)} Tj ET")
+            pages[-1].append(f"BT /{font} {size} Tf {x:.2f} {y:.2f} Td {_pdf_string(line)} Tj ET")
+
+    # Consecutive lines of text form one paragraph
+    paragraph: List[str] = []
+
+    def flush() -> None:
+        if paragraph:
+            text = " ".join(paragraph)
+            emit(_wrap(text, line_width, _PDF_BODY_SIZE), _MARGIN, _PDF_BODY_SIZE, "F1", _PDF_BODY_SIZE * 0.6)
+            paragraph.clear()
+
+    for raw in markdown.splitlines():
+        line = _MD_LINK_RE.sub(r"\1", _MD_EMPHASIS_RE.sub(r"\1", raw.rstrip()))
+        heading = _MD_HEADING_RE.fullmatch(line)
+        item = _MD_LIST_ITEM_RE.fullmatch(line)
+        if heading:
+            flush()
+            size, space_before, font = _PDF_HEADINGS[len(heading.group(1))]
+            # Bold glyphs are up to ~15% wider than the regular metrics used for wrapping
+            emit(_wrap(heading.group(2), line_width / 1.15, size), _MARGIN, size, font, space_before)
+        elif item:
+            flush()
+            depth = len(item.group(1)) // 2 + 1
+            x = _MARGIN + depth * _PDF_INDENT
+            marker = "•" if item.group(2) in ("-", "*") else item.group(2)
+            lines = _wrap(item.group(3), _MARGIN + line_width - x, _PDF_BODY_SIZE)
+            emit(lines, x, _PDF_BODY_SIZE, "F1", _PDF_BODY_SIZE * 0.3, marker)
+        elif line.strip():
+            paragraph.append(line.strip())
+        else:
+            flush()
+    flush()
+
+    # Objects 1-4 are the catalog, page tree and fonts, then a page and its content per page
+    page_ids = [5 + 2 * i for i in range(len(pages))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{' '.join(f'{i} 0 R' for i in page_ids)}] /Count {len(pages)} >>".encode(),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+    ]
+    for page_id, operations in zip(page_ids, pages):
+        content = "\n".join(operations).encode("latin-1")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 {_PAGE_WIDTH} {_PAGE_HEIGHT}] "
+            f"/Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> /Contents {page_id + 1} 0 R >>".encode()
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content))
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+_MINIFIERS = {
+    ".css": minify_css,
+    ".svg": minify_svg,
+}
+
+# Sources built into another format, with the suffix of the built file
+_CONVERTERS = {
+    "assets/Whitepaper": (".pdf", markdown_to_pdf),
+}
+
+
+def hashed_name(path: Path, content: bytes) -> str:
+    """
+    Build a content-hashed filename, e.g. `styles.3f2a9c1b7d4e.css`
+
+    Args:
+        path: Source path of the asset
+        content: Built asset contents
+
+    Returns:
+        Filename including a hash of the contents
+    """
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    return f"{path.stem}.{digest}{path.suffix}"
+
+
+def build_assets() -> Dict[str, str]:
+    """
+    Build every asset into the static directory and write the manifest
+
+    Returns:
+        Manifest mapping source paths to hashed filenames
+    """
+    STATIC_DIR.mkdir(exist_ok=True)
+
+    manifest = {}
+    for source in SOURCES:
+        path = ROOT_DIR / source
+        content = path.read_bytes()
+        minify = _MINIFIERS.get(path.suffix)
+        if minify is not None:
+            content = minify(content.decode("utf-8")).encode("utf-8")
+        if source in _CONVERTERS:
+            suffix, convert = _CONVERTERS[source]
+            content = convert(content.decode("utf-8"))
+            path = path.with_suffix(suffix)
+
+        name = hashed_name(path, content)
+        target = STATIC_DIR / name
+        if not target.exists():
+            target.write_bytes(content)
+        manifest[source] = name
+
+    # Remove outputs of previous builds that no longer match a source
+    current = set(manifest.values())
+    for stale in STATIC_DIR.iterdir():
+        if stale != MANIFEST_PATH and stale.name not in current:
+            stale.unlink()
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return manifest
+
+
+def load_manifest() -> Dict[str, str]:
+    """
+    Load the asset manifest, building the assets if it is missing or out of date
+
+    Returns:
+        Manifest mapping source paths to hashed filenames
+    """
+    if MANIFEST_PATH.exists():
+        built_at = MANIFEST_PATH.stat().st_mtime
+        if all((ROOT_DIR / source).stat().st_mtime <= built_at for source in SOURCES):
+            return json.loads(MANIFEST_PATH.read_text())
+    return build_assets()
+
+
+def asset_path(manifest: Dict[str, str], source: str) -> Path:
+    """
+    Locate the built version of an asset
+
+    Args:
+        manifest: Asset manifest
+        source: Source path of the asset, e.g. "assets/styles.css"
+
+    Returns:
+        Path of the minified, hashed asset
+    """
+    return STATIC_DIR / manifest[source]
+
+
+def asset_url(manifest: Dict[str, str], source: str) -> str:
+    """
+    Build the long-lived cacheable URL of an asset
+
+    Args:
+        manifest: Asset manifest
+        source: Source path of the asset, e.g. "assets/Whitepaper"
+
+    Returns:
+        URL of the hashed asset under Streamlit's static route
+    """
+    name = manifest[source]
+    suffix = Path(name).suffix
+    if suffix not in STATIC_SERVED_SUFFIXES:
+        raise ValueError(f"Streamlit serves {suffix or 'extensionless'} files as text/plain: {source}")
+    # The version argument makes tornado's static handler send far-future cache headers
+    version = name.split(".")[1]
+    return f"app/static/{name}?v={version}"
+
+
+if __name__ == "__main__":
+    for source, name in build_assets().items():
+        print(f"{source} -> {STATIC_DIR.relative_to(ROOT_DIR) / name}")
@@ -19,6 +19,8 @@ from streamlit_extras.stylable_container import stylable_container
 import sys
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
+from asset_pipeline import asset_path, asset_url, load_manifest
+
 # Try to import DapprClient, but don't fail if it's not available
 try:
     from contracts.client import DapprClient
@@ -41,9 +43,26 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def get_asset_manifest():
+    # Built once per server process
+    return load_manifest()
+
+@st.cache_resource
+def read_asset(file_name):
+    # Minified asset, read from disk once per server process instead of every rerun
+    return asset_path(get_asset_manifest(), file_name).read_text()
+
 def local_css(file_name):
-    with open(file_name) as f:
-        st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
+    # Streamlit's static route serves .css as text/plain, so the stylesheet is inlined
+    st.markdown(f'<style>{read_asset(file_name)}</style>', unsafe_allow_html=True)
+
+def local_image(file_name, width):
+    st.image(str(asset_path(get_asset_manifest(), file_name)), width=width)
+
+def static_url(file_name):
+    # Hashed URL under Streamlit's static route, cached by browsers indefinitely
+    return asset_url(get_asset_manifest(), file_name)
 
 # Load custom CSS
 local_css("assets/styles.css")
@@ -154,7 +173,7 @@ st.markdown("""
 
 with st.sidebar:
     # Logo and title
-    st.image("assets/logo.svg", width=50)
+    local_image("assets/logo.svg", width=50)
     st.markdown("<h1 style='color: #14F195; margin-top: 10px;'>DAPPR</h1>", unsafe_allow_html=True)
     
     st.markdown("---")
@@ -277,7 +296,7 @@ elif nav_option == "👤 Account":
         col1, col2 = st.columns([1, 3])
         
         with col1:
-            st.image("assets/logo.svg", width=150)
+            local_image("assets/logo.svg", width=150)
         
         with col2:
             st.markdown(f"### Wallet Address")
@@ -393,7 +412,7 @@ elif nav_option == "📝 Smart Contract":
 
 elif nav_option == "📄 Whitepaper":
     st.title("📄 Whitepaper")
-    st.markdown("""
+    st.markdown(f"""
     ## Decentralized Autonomous Platform for Propagation of Research (DAPPR)
     
     ### Abstract
@@ -406,7 +425,7 @@ elif nav_option == "📄 Whitepaper":
     - **Smart Contracts**: Automated execution of research agreements
     - **Token Economy**: Native token for platform governance and rewards
     
-    [Read the full whitepaper here](https://example.com/whitepaper)
+    [Read the full whitepaper here]({static_url("assets/Whitepaper")})
     """)
 
 elif nav_option == "🎓 Tutorial":
@@ -515,12 +534,12 @@ elif nav_option == "⚙️ Settings":
 # Footer
 st.markdown("---")
 st.markdown("### About DAPPR")
-st.markdown("""
+st.markdown(f"""
 DAPPR is a decentralized platform that bridges the gap between academic research and industry collaboration 
 using Solana blockchain technology. Our mission is to accelerate innovation by creating a transparent, 
 fair, and efficient ecosystem for research funding and collaboration.
 
-[GitHub](https://github.com/Lucky77-afk/Sodh) | [Whitepaper](/assets/Whitepaper)
+[GitHub](https://github.com/Lucky77-afk/Sodh) | [Whitepaper]({static_url("assets/Whitepaper")})
 """)
 
 # Ensure wallet is connected for protected routes
@@ -531,10 +550,10 @@ if nav_option not in ["🏠 Dashboard"] and not st.session_state.connected:
 # Footer
 st.markdown("---")
 st.markdown("### About DAPPR")
-st.markdown("""
+st.markdown(f"""
 DAPPR is a decentralized platform that bridges the gap between academic research and industry collaboration 
 using Solana blockchain technology. Our mission is to accelerate innovation by creating a transparent, 
 fair, and efficient ecosystem for research funding and collaboration.
 
-[GitHub](https://github.com/Lucky77-afk/Sodh) | [Whitepaper](/assets/Whitepaper)
+[GitHub](https://github.com/Lucky77-afk/Sodh) | [Whitepaper]({static_url("assets/Whitepaper")})
 """)
@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The packages live under src/ and are imported as `contracts.*`
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,202 @@
+"""Round-trip tests for the Borsh codecs generated from lib.rs"""
+import enum
+import struct
+
+import pytest
+
+from contracts import borsh_codecs as codecs
+from contracts import codegen
+
+OWNER = bytes(range(32))
+OTHER = bytes(range(32, 64))
+
+
+def make_project(metadata_hash=None, milestones=2):
+    return codecs.ResearchProject(
+        is_initialized=True,
+        owner=OWNER,
+        title="Scalable zero-knowledge proofs",
+        description="Research on succinct proofs ✓",
+        status=codecs.ProjectStatus.PendingReview,
+        funding_goal=1_000_000_000,
+        funds_raised=250_000_000,
+        participants=[OWNER, OTHER],
+        ip_terms=codecs.IPTerms(
+            ownership_split=[(OWNER, 60), (OTHER, 40)],
+            license_type="MIT",
+            commercial_rights=True,
+        ),
+        milestones=[
+            codecs.Milestone(
+                title=f"Milestone {index}",
+                description="Deliverable",
+                deadline=-1 if index == 0 else 1_700_000_000 + index,
+                reward=10_000_000,
+                completed=index % 2 == 0,
+            )
+            for index in range(milestones)
+        ],
+        metadata_hash=metadata_hash,
+    )
+
+
+INSTRUCTIONS = [
+    codecs.DapprInstruction.CreateProject(
+        title="Title",
+        description="Description",
+        funding_goal=5,
+        ip_terms=codecs.IPTerms(ownership_split=[(OWNER, 100)], license_type="GPL", commercial_rights=False),
+    ),
+    codecs.DapprInstruction.FundProject(amount=42),
+    codecs.DapprInstruction.AddMilestone(title="M", description="D", deadline=1_700_000_000, reward=7),
+    codecs.DapprInstruction.CompleteMilestone(milestone_index=3),
+    codecs.DapprInstruction.DisputeResolution(resolution="Split 50/50"),
+    codecs.DapprInstruction.FundProjectDeferred(amount=2**64 - 1),
+    codecs.DapprInstruction.AggregateFunding(),
+    codecs.DapprInstruction.CreateProjectCompact(title="Compact", funding_goal=5, metadata_hash=OTHER),
+]
+
+
+@pytest.mark.parametrize("metadata_hash", [None, OTHER])
+@pytest.mark.parametrize("milestones", [0, 3])
+def test_project_round_trip(metadata_hash, milestones):
+    project = make_project(metadata_hash, milestones)
+    data = project.encode()
+    assert len(data) == project.encoded_size()
+    decoded = codecs.ResearchProject.decode(data)
+    assert decoded == project
+    assert decoded.encode() == data
+
+
+@pytest.mark.parametrize("metadata_hash", [None, OTHER])
+def test_project_decodes_from_padded_account(metadata_hash):
+    project = make_project(metadata_hash)
+    data = project.encode()
+    decoded, offset = codecs.ResearchProject.decode_from(data.ljust(1024, b"\0"))
+    assert decoded == project
+    assert offset == len(data)
+
+
+def test_project_wire_format():
+    data = make_project(None, milestones=0).encode()
+    assert data[0] == 1
+    assert data[1:33] == OWNER
+    (title_length,) = struct.unpack_from("<I", data, 33)
+    assert data[37:37 + title_length] == b"Scalable zero-knowledge proofs"
+    assert data[-1] == 0  # metadata_hash: None
+    assert codecs.ResearchProject.decode(data).status is codecs.ProjectStatus.PendingReview
+
+
+def test_receipt_round_trip():
+    receipt = codecs.FundingReceipt(True, OWNER, OTHER, 7, 2**64 - 1, 255)
+    data = receipt.encode()
+    assert len(data) == 82
+    assert codecs.FundingReceipt.decode(data) == receipt
+
+
+def test_instructions_cover_every_variant():
+    assert [type(instruction) for instruction in INSTRUCTIONS] == list(codecs._DAPPRINSTRUCTION_VARIANTS)
+
+
+@pytest.mark.parametrize("instruction", INSTRUCTIONS, ids=lambda instruction: type(instruction).__name__)
+def test_instruction_round_trip(instruction):
+    data = instruction.encode()
+    assert data[0] == instruction.VARIANT
+    assert len(data) == instruction.encoded_size()
+    decoded = codecs.DapprInstruction.decode(data)
+    assert type(decoded) is type(instruction)
+    assert decoded == instruction
+
+
+def test_instruction_wire_format():
+    assert codecs.DapprInstruction.FundProjectDeferred(amount=7).encode() == b"\x05" + (7).to_bytes(8, "little")
+    assert codecs.DapprInstruction.AggregateFunding().encode() == b"\x06"
+
+
+def test_generated_module_is_up_to_date():
+    assert codegen.generate(codegen.SOURCE_PATH.read_text()) == codegen.OUTPUT_PATH.read_text()
+
+
+def plain(value):
+    """Reduce generated codecs and borsh-construct containers to comparable builtins"""
+    if isinstance(value, codecs._Codec):
+        return {name: plain(getattr(value, name)) for name in value.__slots__}
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, dict):
+        return {key: plain(item) for key, item in value.items() if not key.startswith("_")}
+    if isinstance(value, (list, tuple)):
+        return [plain(item) for item in value]
+    if type(value).__module__ == "sumtypes":
+        # borsh-construct parses unit enum variants into sumtype instances
+        return type(value).__name__
+    return value
+
+
+@pytest.mark.parametrize("metadata_hash", [None, OTHER])
+def test_matches_borsh_construct(metadata_hash):
+    pytest.importorskip("borsh_construct")
+    schema = codegen.construct_schema(codegen.parse_source(codegen.SOURCE_PATH.read_text()), "ResearchProject")
+    data = make_project(metadata_hash).encode()
+    parsed = schema.parse(data)
+    assert plain(parsed) == plain(codecs.ResearchProject.decode(data))
+    assert schema.build(parsed) == make_project(metadata_hash).encode()
+
+
+def test_decode_rejects_string_overrunning_buffer():
+    data = bytearray(make_project(None, milestones=0).encode())
+    struct.pack_into("<I", data, 33, len(data))
+    with pytest.raises(ValueError, match="overruns"):
+        codecs.ResearchProject.decode(bytes(data))
+    with pytest.raises(ValueError, match="overruns"):
+        codecs.ResearchProject.decode(make_project(None).encode()[:50])
+
+
+def test_decode_rejects_vec_overrunning_buffer():
+    data = bytearray(make_project(None).ip_terms.encode())
+    struct.pack_into("<I", data, 0, 3)
+    with pytest.raises(ValueError, match="overruns"):
+        codecs.IPTerms.decode(bytes(data))
+
+
+def test_decode_rejects_invalid_bool():
+    data = bytearray(make_project(None).encode())
+    data[0] = 2
+    with pytest.raises(ValueError, match="Invalid bool at offset 0"):
+        codecs.ResearchProject.decode(bytes(data))
+
+    milestone = bytearray(make_project(None).milestones[0].encode())
+    milestone[-1] = 0xFF
+    with pytest.raises(ValueError, match="Invalid bool"):
+        codecs.Milestone.decode(bytes(milestone))
+
+
+def test_decode_rejects_invalid_option_tag():
+    data = bytearray(make_project(None).encode())
+    data[-1] = 2
+    with pytest.raises(ValueError, match="Invalid option tag"):
+        codecs.ResearchProject.decode(bytes(data))
+
+
+@pytest.mark.parametrize("field, value", [
+    ("owner", OWNER[:31]),
+    ("participants", [OWNER, OTHER + b"\0"]),
+    ("metadata_hash", b""),
+    ("ip_terms", codecs.IPTerms([(OWNER[:16], 100)], "MIT", True)),
+])
+def test_encode_rejects_wrong_byte_array_length(field, value):
+    project = make_project(OTHER)
+    setattr(project, field, value)
+    with pytest.raises(ValueError, match="Expected 32 bytes"):
+        project.encode()
+
+
+def test_layout_decodes_legacy_account_without_metadata_hash():
+    pytest.importorskip("base58")
+    from contracts.layout import decode_project
+
+    data = make_project(None).encode()[:-1]
+    project = decode_project(data)
+    assert project["metadata_hash"] is None
+    assert project["status"] == "PendingReview"
+    assert project["ip_terms"]["ownership_split"][1][1] == 40
@@ -0,0 +1,151 @@
+"""Tests for priority-fee estimation and fee-bumping resubmission"""
+import asyncio
+
+import pytest
+
+pytest.importorskip("requests")
+# The client targets the legacy solana-py API with `solana.publickey`
+pytest.importorskip("solana.publickey")
+
+from solana.rpc.core import RPCException
+
+from contracts import fees
+from contracts.fees import PriorityFeeEstimator, _FeeWindow, send_with_fee_bump
+
+ACCOUNTS = ["Acct1111111111111111111111111111111111111111"]
+OTHER_ACCOUNTS = ["Acct2222222222222222222222222222222222222222"]
+
+
+def entries(*pairs):
+    return [{"slot": slot, "prioritizationFee": fee} for slot, fee in pairs]
+
+
+def test_window_keeps_highest_fee_per_slot():
+    window = _FeeWindow(10)
+    window.observe(entries((1, 100), (2, 200)))
+    window.observe(entries((1, 50), (2, 300)))
+    assert window.seen_slots == {1: 100, 2: 300}
+    assert window.fees == [100, 300]
+
+
+def test_window_evicts_oldest_slots():
+    window = _FeeWindow(3)
+    window.observe(entries((1, 500), (2, 10), (3, 20), (4, 30)))
+    assert list(window.slots) == [2, 3, 4]
+    assert window.fees == [10, 20, 30]
+
+
+def test_window_percentile():
+    window = _FeeWindow(100)
+    assert window.percentile(50) == 0
+    window.observe(entries(*((slot, slot * 10) for slot in range(1, 11))))
+    assert window.percentile(0) == 10
+    assert window.percentile(50) == 60
+    assert window.percentile(90) == 100
+    assert window.percentile(100) == 100
+
+
+def test_estimator_keeps_a_model_per_account_set():
+    estimator = PriorityFeeEstimator("http://rpc", refresh_interval=float("inf"))
+    estimator.observe(ACCOUNTS, entries((1, 1_000)))
+    estimator.observe(OTHER_ACCOUNTS, entries((1, 10)))
+    assert estimator.percentile(ACCOUNTS, 50) == 1_000
+    assert estimator.percentile(OTHER_ACCOUNTS, 50) == 10
+
+
+def test_estimate_falls_back_when_the_rpc_fails(monkeypatch):
+    calls = []
+
+    def post(*args, **kwargs):
+        calls.append(args)
+        raise fees.requests.RequestException("connection refused")
+
+    monkeypatch.setattr(fees.requests, "post", post)
+    estimator = PriorityFeeEstimator("http://rpc", min_price=5, refresh_interval=60)
+    assert estimator.estimate(ACCOUNTS) == 5
+
+    estimator.observe(ACCOUNTS, entries((1, 2_000)))
+    assert estimator.estimate(ACCOUNTS) == 2_000
+    # The failed sample counts as a refresh, so the RPC isn't retried right away
+    assert len(calls) == 1
+
+
+class FakeClient:
+    """Solana client whose attempts land or fail according to a script"""
+
+    def __init__(self, outcomes, reject_after=None):
+        self.outcomes = outcomes
+        self.reject_after = reject_after
+        self.sent = []
+        self.attempts = 0
+
+    def send_transaction(self, price, *signers):
+        self.attempts += 1
+        if self.reject_after is not None and len(self.sent) >= self.reject_after:
+            raise RPCException("Allocate: account already in use")
+        self.sent.append(price)
+        return {"result": f"sig{len(self.sent)}"}
+
+    def get_signature_statuses(self, signatures):
+        return {"result": {"value": [self.outcomes(signature, self.attempts) for signature in signatures]}}
+
+
+def send(client, **kwargs):
+    kwargs.setdefault("confirm_timeout", 0.02)
+    kwargs.setdefault("poll_interval", 0.001)
+    return asyncio.run(send_with_fee_bump(client, lambda price: price, [], initial_price=100, **kwargs))
+
+
+def test_fee_bump_returns_first_confirmed_signature():
+    client = FakeClient(lambda signature, _: {"err": None, "confirmationStatus": "confirmed"})
+    assert send(client) == "sig1"
+    assert client.sent == [100]
+
+
+def test_fee_bump_raises_the_price_until_confirmed():
+    def outcomes(signature, _):
+        return {"err": None, "confirmationStatus": "confirmed"} if signature == "sig3" else None
+
+    client = FakeClient(outcomes)
+    assert send(client, bump_factor=2) == "sig3"
+    assert client.sent == [100, 200, 400]
+
+
+def test_fee_bump_caps_the_price():
+    client = FakeClient(lambda signature, _: None)
+    with pytest.raises(TimeoutError, match="sig1, sig2, sig3"):
+        send(client, max_attempts=3, max_price=150)
+    assert client.sent == [100, 150, 150]
+
+
+def test_fee_bump_keeps_polling_when_a_bump_fails_on_chain():
+    def outcomes(signature, attempts):
+        if signature == "sig2":
+            return {"err": {"InstructionError": [1, "AccountAlreadyInitialized"]}}
+        if signature == "sig1" and attempts == 3:
+            return {"err": None, "confirmationStatus": "confirmed"}
+        return None
+
+    client = FakeClient(outcomes)
+    assert send(client, max_attempts=3) == "sig1"
+
+
+def test_fee_bump_keeps_polling_when_a_bump_fails_preflight():
+    def outcomes(signature, attempts):
+        return {"err": None, "confirmationStatus": "confirmed"} if attempts == 3 else None
+
+    client = FakeClient(outcomes, reject_after=1)
+    assert send(client, max_attempts=3) == "sig1"
+    assert client.sent == [100]
+
+
+def test_fee_bump_raises_when_the_first_send_fails():
+    client = FakeClient(lambda signature, _: None, reject_after=0)
+    with pytest.raises(RPCException):
+        send(client)
+
+
+def test_fee_bump_raises_once_every_attempt_failed():
+    client = FakeClient(lambda signature, _: {"err": "InsufficientFundsForFee"})
+    with pytest.raises(RuntimeError, match="sig1 failed"):
+        send(client)
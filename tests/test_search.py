@@ -0,0 +1,193 @@
+"""Tests for the incremental full-text search index"""
+import pytest
+
+from contracts.search import PartialProject, SearchIndex, tokenize
+
+
+def project(title, description="", license_type="MIT", owner="Owner1111", is_initialized=True):
+    return {
+        "title": title,
+        "description": description,
+        "ip_terms": {"license_type": license_type},
+        "owner": owner,
+        "is_initialized": is_initialized,
+    }
+
+
+def projects(result):
+    return [entry.project for entry in result.results]
+
+
+@pytest.fixture
+def index():
+    index = SearchIndex()
+    index.add("zk", project("Zero-knowledge proofs", "Succinct proofs for quantum-safe rollups"))
+    index.add("qec", project("Quantum error correction", "Surface codes and decoders", "Apache 2.0"))
+    index.add("bio", project("Protein folding", "Quantum chemistry on error-prone hardware", "GPL v3"))
+    return index
+
+
+def test_tokenize():
+    assert tokenize("Zero-Knowledge, proofs!") == ["zero", "knowledge", "proofs"]
+
+
+def test_ranks_title_matches_first(index):
+    result = index.search("quantum")
+    assert result.total == 3
+    assert projects(result)[0] == "qec"
+
+
+def test_every_clause_must_match(index):
+    assert projects(index.search("quantum apache")) == ["qec"]
+    assert index.search("quantum nonexistent").total == 0
+
+
+def test_prefix_matches(index):
+    assert set(projects(index.search("quant"))) == {"zk", "qec", "bio"}
+    assert projects(index.search("fold")) == ["bio"]
+    assert index.search("owner1").total == 3
+
+
+def test_phrase_matches_within_a_field(index):
+    assert projects(index.search('"error correction"')) == ["qec"]
+    assert index.search('"correction error"').total == 0
+    # The title ends where the license begins, phrases never span fields
+    assert index.search('"correction apache"').total == 0
+
+
+def test_phrases_skip_descriptions_by_default(index):
+    assert index.search('"quantum chemistry"').total == 0
+
+    full = SearchIndex(phrase_fields=("title", "description"))
+    full.add("bio", project("Protein folding", "Quantum chemistry on error-prone hardware"))
+    assert projects(full.search('"quantum chemistry"')) == ["bio"]
+
+
+def test_rejects_unknown_phrase_fields():
+    with pytest.raises(ValueError, match="summary"):
+        SearchIndex(phrase_fields=("title", "summary"))
+
+
+def test_replace_and_remove(index):
+    index.add("qec", project("Lattice cryptography"))
+    assert set(projects(index.search("quantum"))) == {"zk", "bio"}
+    assert projects(index.search("lattice")) == ["qec"]
+    assert index.search('"error correction"').total == 0
+
+    index.remove("zk")
+    index.remove("zk")
+    assert "zk" not in index
+    assert len(index) == 2
+    assert index.search("succinct").total == 0
+    assert projects(index.search("quantum")) == ["bio"]
+
+
+def test_update_removes_uninitialized_projects(index):
+    index.update([("bio", None), ("zk", project("Closed", is_initialized=False)), ("new", project("Fresh"))])
+    assert sorted(index._doc_ids) == ["new", "qec"]
+
+
+def test_compaction_drops_removed_postings():
+    index = SearchIndex()
+    for number in range(20):
+        index.add(f"p{number}", project(f"Project unique{number}", "shared words"))
+    vocabulary = index.vocabulary_size
+    for number in range(10):
+        index.remove(f"p{number}")
+
+    # Removals are compacted in bulk, the last one may still be pending
+    assert len(index._deleted) <= 1
+    assert index.vocabulary_size <= vocabulary - 9
+    assert index.search("unique3").total == 0
+    assert index.search("unique9").total == 0
+    assert index.search("unique").total == 10
+    assert index.search("shared").total == 10
+    assert set(projects(index.search("project", page_size=50))) == {f"p{number}" for number in range(10, 20)}
+
+
+def test_pagination():
+    index = SearchIndex()
+    for number in range(25):
+        index.add(f"p{number}", project("Project " + "graph " * (number % 5 + 1)))
+
+    pages = [index.search("graph", page=page, page_size=10) for page in range(4)]
+    assert [page.total for page in pages] == [25] * 4
+    assert [len(page.results) for page in pages] == [10, 10, 5, 0]
+    found = [entry.project for page in pages for entry in page.results]
+    assert sorted(found) == sorted(f"p{number}" for number in range(25))
+    scores = [entry.score for page in pages for entry in page.results]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_pagination_skips_removed_projects():
+    index = SearchIndex()
+    for number in range(40):
+        index.add(f"p{number}", project("Graph " * (number % 7 + 1)))
+    for number in range(0, 40, 4):
+        index.remove(f"p{number}")
+    assert index._deleted
+
+    result = index.search("graph", page=2, page_size=10)
+    assert result.total == 30
+    assert len(result.results) == 10
+    assert not {entry.project for entry in result.results} & {f"p{number}" for number in range(0, 40, 4)}
+
+
+@pytest.mark.parametrize("page, page_size", [(-1, 10), (0, 0), (0, -5)])
+def test_rejects_invalid_pages(index, page, page_size):
+    with pytest.raises(ValueError):
+        index.search("quantum", page=page, page_size=page_size)
+
+
+def test_sync_only_decodes_changed_accounts():
+    decoded = []
+
+    def decode(data):
+        decoded.append(data)
+        return project(data.decode())
+
+    index = SearchIndex()
+    assert index.sync([("a", b"Alpha"), ("b", b"Beta"), ("c", b"Gamma")], decode) == 3
+    assert index.sync([("a", b"Alpha"), ("b", b"Beta"), ("c", b"Gamma")], decode) == 0
+    assert decoded == [b"Alpha", b"Beta", b"Gamma"]
+
+    # b changed and c was closed
+    assert index.sync([("a", b"Alpha"), ("b", b"Delta")], decode) == 2
+    assert decoded[3:] == [b"Delta"]
+    assert "c" not in index
+    assert projects(index.search("delta")) == ["b"]
+    assert index.search("beta").total == 0
+    assert index.search("gamma").total == 0
+
+
+def test_empty_queries(index):
+    assert index.search("").total == 0
+    assert index.search('""').total == 0
+    assert SearchIndex().search("quantum").total == 0
+
+
+def test_sync_retries_partial_projects():
+    blobs = {}
+
+    def decode(data):
+        fields = project(data.decode())
+        if data in blobs:
+            return dict(fields, description=blobs[data])
+        return PartialProject(fields)
+
+    index = SearchIndex()
+    assert index.sync([("a", b"Compact")], decode) == 1
+    assert index.search("offchain").total == 0
+
+    # The blob becomes available, the unchanged account is decoded again
+    blobs[b"Compact"] = "Offchain description"
+    assert index.sync([("a", b"Compact")], decode) == 1
+    assert projects(index.search("offchain")) == ["a"]
+    assert index.sync([("a", b"Compact")], decode) == 0
+
+
+def test_sync_removes_closed_partial_projects():
+    index = SearchIndex()
+    index.sync([("a", b"Compact")], lambda data: PartialProject(project(data.decode())))
+    assert index.sync([], lambda data: None) == 1
+    assert "a" not in index
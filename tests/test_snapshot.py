@@ -0,0 +1,86 @@
+"""Tests for columnar snapshot export and loading"""
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pytest.importorskip("base58")
+
+from contracts import borsh_codecs as codecs
+from contracts.layout import decode_project
+from contracts.snapshot import SnapshotWriter, export_snapshot, load_snapshot, load_table
+
+OWNER = bytes(range(32))
+OTHER = bytes(range(32, 64))
+
+
+def account(title, milestones=1, size=1024):
+    project = codecs.ResearchProject(
+        is_initialized=True,
+        owner=OWNER,
+        title=title,
+        description=f"Description of {title}",
+        status=codecs.ProjectStatus.Active,
+        funding_goal=1_000,
+        funds_raised=250,
+        participants=[OWNER, OTHER],
+        ip_terms=codecs.IPTerms(
+            ownership_split=[(OWNER, 70), (OTHER, 30)],
+            license_type="MIT",
+            commercial_rights=False,
+        ),
+        milestones=[
+            codecs.Milestone(f"Milestone {index}", "Deliverable", 1_700_000_000, 100, index == 0)
+            for index in range(milestones)
+        ],
+        metadata_hash=None,
+    )
+    data = project.encode()
+    return data + bytes(size - len(data))
+
+
+def accounts(count):
+    return [(f"project-{index}", account(f"Project {index}")) for index in range(count)]
+
+
+def test_export_round_trip(tmp_path):
+    assert export_snapshot(accounts(5), tmp_path / "snapshot", chunk_size=2) == 5
+
+    assert sorted(path.name for path in (tmp_path / "snapshot" / "projects").iterdir()) == [
+        "part-00000.arrow", "part-00001.arrow", "part-00002.arrow",
+    ]
+    tables = load_snapshot(tmp_path / "snapshot")
+    projects = tables["projects"]
+    assert projects.num_rows == 5
+    assert projects.column("title").to_pylist() == [f"Project {index}" for index in range(5)]
+    assert projects.column("status").to_pylist() == ["Active"] * 5
+    assert projects.column("metadata_hash").to_pylist() == [None] * 5
+    assert tables["participants"].num_rows == 10
+    assert tables["ip_ownership"].column("percentage").to_pylist() == [70, 30] * 5
+    assert tables["milestones"].column("completed").to_pylist() == [True] * 5
+
+
+def test_reexport_replaces_previous_snapshot(tmp_path):
+    directory = tmp_path / "snapshot"
+    export_snapshot(accounts(25), directory, chunk_size=5)
+    export_snapshot(accounts(5), directory, chunk_size=5)
+
+    assert load_table(directory, "projects").num_rows == 5
+    # Only the target directory is left behind, no staging directories
+    assert [path.name for path in tmp_path.iterdir()] == ["snapshot"]
+
+
+def test_export_skips_undecodable_accounts(tmp_path, caplog):
+    bad = [("truncated", account("Truncated")[:40]), ("empty", b"")]
+    assert export_snapshot(accounts(2) + bad, tmp_path / "snapshot") == 2
+    assert "Skipped 2 project accounts" in caplog.text
+
+
+def test_failed_export_keeps_previous_snapshot(tmp_path):
+    directory = tmp_path / "snapshot"
+    export_snapshot(accounts(3), directory)
+
+    with pytest.raises(RuntimeError):
+        with SnapshotWriter(directory, chunk_size=1) as writer:
+            writer.add("partial", decode_project(account("Partial")))
+            raise RuntimeError("scan interrupted")
+    assert load_table(directory, "projects").num_rows == 3
+    assert [path.name for path in tmp_path.iterdir()] == ["snapshot"]
@@ -0,0 +1,89 @@
+"""Tests for content-addressed off-chain project metadata"""
+import pytest
+
+from contracts.storage import LocalBlobStore, MetadataStore, content_hash, encode_metadata
+
+OWNER = "Owner1111111111111111111111111111111111111"
+IP_TERMS = {"ownership_split": [(OWNER, 100)], "license_type": "MIT", "commercial_rights": True}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return MetadataStore(LocalBlobStore(tmp_path / "blobs"), cache_size=2)
+
+
+def compact_project(metadata_hash):
+    return {
+        "title": "Compact",
+        "description": "",
+        "ip_terms": {"ownership_split": [], "license_type": "", "commercial_rights": False},
+        "metadata_hash": metadata_hash,
+    }
+
+
+def test_put_is_content_addressed(store):
+    digest = store.put("Long description", IP_TERMS)
+    assert digest == content_hash(encode_metadata("Long description", IP_TERMS))
+    assert store.put("Long description", dict(reversed(list(IP_TERMS.items())))) == digest
+    assert store.get(digest) == {
+        "description": "Long description",
+        "ip_terms": {"ownership_split": [[OWNER, 100]], "license_type": "MIT", "commercial_rights": True},
+    }
+
+
+def test_get_returns_copies(store):
+    digest = store.put("Description", IP_TERMS)
+    store.get(digest)["ip_terms"]["license_type"] = "changed"
+    assert store.get(digest)["ip_terms"]["license_type"] == "MIT"
+
+
+def test_get_missing_blob(store):
+    with pytest.raises(KeyError):
+        store.get(bytes(32))
+
+
+def test_get_rejects_hash_mismatch(store, tmp_path):
+    digest = store.put("Description", IP_TERMS)
+    path = tmp_path / "blobs" / digest.hex()[:2] / digest.hex()[2:]
+    path.write_bytes(path.read_bytes().replace(b"MIT", b"GPL"))
+    with pytest.raises(ValueError, match="does not match"):
+        store.get(digest)
+
+
+def test_resolve_applies_metadata(store):
+    project = compact_project(store.put("Off-chain description", IP_TERMS))
+    resolved = store.resolve(project)
+    assert resolved["description"] == "Off-chain description"
+    assert resolved["ip_terms"] == {"ownership_split": [(OWNER, 100)], "license_type": "MIT", "commercial_rights": True}
+    # The decoded project is left untouched
+    assert project["description"] == ""
+    assert project["ip_terms"]["ownership_split"] == []
+
+
+@pytest.mark.parametrize("ip_terms", [
+    {"ownership_split": [OWNER, 100], "license_type": "MIT", "commercial_rights": True},
+    {"ownership_split": [(OWNER, 300)], "license_type": "MIT", "commercial_rights": True},
+    {"ownership_split": [(OWNER, True)], "license_type": "MIT", "commercial_rights": True},
+    {"ownership_split": [(1, 100)], "license_type": "MIT", "commercial_rights": True},
+    {"ownership_split": [], "license_type": 7, "commercial_rights": True},
+    {"ownership_split": [], "license_type": "MIT", "commercial_rights": "yes"},
+    {"ownership_split": [], "license_type": "MIT"},
+    {"ownership_split": [], "license_type": "MIT", "commercial_rights": True, "extra": 1},
+    [],
+])
+def test_put_rejects_malformed_ip_terms(store, ip_terms):
+    with pytest.raises(ValueError):
+        store.put("Description", ip_terms)
+
+
+@pytest.mark.parametrize("blob", [
+    b'{"description":"x","ip_terms":{"commercial_rights":true,"license_type":"MIT","ownership_split":["Owner",100]}}',
+    b'{"description":"x","ip_terms":{"commercial_rights":true,"license_type":"MIT","ownership_split":[["Owner",256]]}}',
+    b'{"description":1,"ip_terms":{"commercial_rights":true,"license_type":"MIT","ownership_split":[]}}',
+    b'["not", "metadata"]',
+    b"\xff\xfe",
+])
+def test_resolve_rejects_malformed_blobs(store, blob):
+    digest = store.backend.put(blob)
+    with pytest.raises(ValueError):
+        store.resolve(compact_project(digest))